@@ -94,7 +94,7 @@ def empty() -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable
         async def wrapper(session: web.Committer | None, *args: Any, **kwargs: Any) -> Any:
             match session:
                 case web.Committer() as committer:
-                    form_data = await committer.form_data()
+                    form_data = await committer.form_data_readonly()
                 case None:
                     form_data = await atr.form.quart_request()
             try:
@@ -132,7 +132,7 @@ def form(
         async def wrapper(session: web.Committer | None, *args: Any, **kwargs: Any) -> Any:
             match session:
                 case web.Committer() as committer:
-                    form_data = await committer.form_data()
+                    form_data = await committer.form_data_readonly()
                 case None:
                     form_data = await atr.form.quart_request()
             try:
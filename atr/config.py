@@ -128,7 +128,7 @@ class AppConfig:
             "arm",
             "wave",
         }
-        | set(ADMIN_USERS_ADDITIONAL.split(",") if ADMIN_USERS_ADDITIONAL else [])
+        | {uid.strip() for uid in ADMIN_USERS_ADDITIONAL.split(",") if uid.strip()}
     )
 
 
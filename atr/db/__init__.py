@@ -358,6 +358,8 @@ class Session(sqlalchemy.ext.asyncio.AsyncSession):
         committee_name: Opt[str] = NOT_SET,
         release_policy_id: Opt[int] = NOT_SET,
         status: Opt[sql.ProjectStatus] = NOT_SET,
+        committee_member: Opt[str] = NOT_SET,
+        committee_participant: Opt[str] = NOT_SET,
         _committee: bool = True,
         _releases: bool = False,
         _distribution_channels: bool = False,
@@ -377,6 +379,17 @@ class Session(sqlalchemy.ext.asyncio.AsyncSession):
             query = query.where(sql.Project.release_policy_id == release_policy_id)
         if is_defined(status):
             query = query.where(sql.Project.status == status)
+        if is_defined(committee_member):
+            query = query.where(
+                _project_committee_where(_json_array_contains(sql.Committee.committee_members, committee_member))
+            )
+        if is_defined(committee_participant):
+            query = query.where(
+                _project_committee_where(
+                    _json_array_contains(sql.Committee.committee_members, committee_participant)
+                    | _json_array_contains(sql.Committee.committers, committee_participant)
+                )
+            )
 
         # Avoid multiple loaders for Project.committee on the same path
         if _committee_public_signing_keys:
@@ -1019,3 +1032,15 @@ async def shutdown_database() -> None:
         await _global_atr_engine.dispose()
     else:
         log.info("No database to close")
+
+
+def _json_array_contains(column: Any, value: str) -> sqlalchemy.ColumnElement[bool]:
+    # Uses the SQLite json_each table valued function to test membership in the database
+    elements = sqlalchemy.func.json_each(sql.validate_instrumented_attribute(column)).table_valued("value")
+    return sqlalchemy.select(1).select_from(elements).where(elements.c.value == value).exists()
+
+
+def _project_committee_where(condition: sqlalchemy.ColumnElement[bool]) -> sqlalchemy.ColumnElement[bool]:
+    via = sql.validate_instrumented_attribute
+    committee_names = sqlmodel.select(via(sql.Committee.name)).where(condition)
+    return via(sql.Project.committee_name).in_(committee_names)
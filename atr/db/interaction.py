@@ -308,6 +308,37 @@ async def releases_by_phase(project: sql.Project, phase: sql.ReleasePhase) -> li
     return results
 
 
+async def releases_by_phase_for_projects(projects: Sequence[sql.Project], phase: sql.ReleasePhase) -> list[sql.Release]:
+    """Get the releases for several projects by phase, in a single query."""
+    projects_by_name = {project.name: project for project in projects}
+    if not projects_by_name:
+        return []
+
+    via = sql.validate_instrumented_attribute
+    query = (
+        sqlmodel.select(sql.Release)
+        .where(
+            via(sql.Release.project_name).in_(projects_by_name),
+            sql.Release.phase == phase,
+        )
+        .order_by(via(sql.Release.created).desc())
+    )
+
+    # Group by project in the order given, as if releases_by_phase had been called for each
+    releases_by_project: dict[str, list[sql.Release]] = {name: [] for name in projects_by_name}
+    async with db.session() as data:
+        for release in (await data.execute(query)).scalars():
+            releases_by_project[release.project_name].append(release)
+
+    results = []
+    for project_name, releases in releases_by_project.items():
+        for release in releases:
+            # Don't need to eager load and lose it when the session closes
+            release.project = projects_by_name[project_name]
+        results.extend(releases)
+    return results
+
+
 async def releases_in_progress(project: sql.Project) -> list[sql.Release]:
     """Get the releases in progress for the project."""
     drafts = await candidate_drafts(project)
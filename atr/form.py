@@ -38,7 +38,7 @@ import atr.models.schema as schema
 import atr.util as util
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, Mapping
 
     import pydantic_core
 
@@ -80,7 +80,7 @@ def csrf_input() -> htm.VoidElement:
 
 
 def flash_error_data(
-    form_cls: type[Form] | TypeAliasType, errors: list[pydantic_core.ErrorDetails], form_data: dict[str, Any]
+    form_cls: type[Form] | TypeAliasType, errors: list[pydantic_core.ErrorDetails], form_data: Mapping[str, Any]
 ) -> dict[str, Any]:
     flash_data = {}
     error_field_names = set()
@@ -609,7 +609,7 @@ class Set[EnumType: enum.Enum]:
 URL = pydantic.HttpUrl
 
 
-def validate(model_cls: Any, form: dict[str, Any], context: dict[str, Any] | None = None) -> pydantic.BaseModel:
+def validate(model_cls: Any, form: Mapping[str, Any], context: dict[str, Any] | None = None) -> pydantic.BaseModel:
     # Since pydantic.TypeAdapter accepts Any, we do the same
     return pydantic.TypeAdapter(model_cls).validate_python(form, context=context)
 
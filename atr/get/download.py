@@ -48,6 +48,7 @@ async def all_selected(session: web.Committer, project_name: str, version_name:
         user_ssh_keys = await data.ssh_key(asf_uid=session.uid).all()
 
     back_url = mapping.release_as_url(release)
+    file_count, _total_bytes, formatted_size = await util.get_release_stats(release)
 
     return await template.render(
         "download-all.html",
@@ -59,7 +60,8 @@ async def all_selected(session: web.Committer, project_name: str, version_name:
         server_host=session.app_host,
         user_ssh_keys=user_ssh_keys,
         back_url=back_url,
-        get_release_stats=util.get_release_stats,
+        file_count=file_count,
+        formatted_size=formatted_size,
     )
 
 
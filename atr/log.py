@@ -82,6 +82,11 @@ def debug(msg: str) -> None:
     _event(logging.DEBUG, msg)
 
 
+def enabled(level: int) -> bool:
+    # Whether a message at this level from the caller would be logged
+    return _caller_logger(depth=2).isEnabledFor(level)
+
+
 def error(msg: str) -> None:
     _event(logging.ERROR, msg)
 
@@ -28,6 +28,8 @@ import pathlib
 
 import asfquart.base as base
 
+import atr.template as template
+
 
 def setup_template_preloading(app: base.QuartApp) -> None:
     """Register the template preloading to happen before the async loop starts."""
@@ -72,6 +74,7 @@ def _preload_templates(app: base.QuartApp) -> None:
 
             # Access the template to make Jinja load and cache it
             app.jinja_env.get_template(template_name)
+            template.sync_environment(app).get_template(template_name)
         except Exception as e:
             print(f"Error preloading template {template_file}: {e}")
     print(f"Preloaded {len(template_files)} templates")
@@ -44,20 +44,24 @@ import atr.user as user
 # Do not rename this interface
 # It is named to reserve the atr.storage.audit logger name
 def audit(**kwargs: basic.JSON) -> None:
+    # The atr.log logger should give the same name
+    # But to be extra sure, we set it manually
+    logger = logging.getLogger("atr.storage.audit")
+    # Skip building the entry when nothing would record it
+    if not logger.isEnabledFor(logging.INFO):
+        return
     now = datetime.datetime.now(datetime.UTC).isoformat(timespec="milliseconds")
     now = now.replace("+00:00", "Z")
     action = log.caller_name(depth=2)
     kwargs = {"datetime": now, "action": action, **kwargs}
     msg = json.dumps(kwargs, allow_nan=False)
-    # The atr.log logger should give the same name
-    # But to be extra sure, we set it manually
-    logger = logging.getLogger("atr.storage.audit")
-    # TODO: Convert to async
+    # In the server this logger has a QueueHandler, so file I/O happens on the listener thread
     logger.info(msg)
 
 
 class AccessAs:
     def append_to_audit_log(self, **kwargs: basic.JSON) -> None:
+        """Append an entry to the audit log, leaving the file I/O to the queue listener thread."""
         audit(**kwargs)
 
 
@@ -449,8 +449,12 @@ class CommitteeParticipant(FoundationCommitter):
     def committee_name(self) -> str:
         return self.__committee_name
 
-    async def ensure_associated(self, keys_file_text: str) -> outcome.List[types.Key]:
-        outcomes: outcome.List[types.Key] = await self.__ensure(keys_file_text, associate=True)
+    async def ensure_associated(
+        self, keys_file_text: str, email_to_uid: dict[str, str] | None = None
+    ) -> outcome.List[types.Key]:
+        outcomes: outcome.List[types.Key] = await self.__ensure(
+            keys_file_text, associate=True, email_to_uid=email_to_uid
+        )
         if outcomes.any_result:
             await self.autogenerate_keys_file()
         return outcomes
@@ -605,10 +609,13 @@ class CommitteeParticipant(FoundationCommitter):
         await self.__data.commit()
         return outcomes
 
-    async def __ensure(self, keys_file_text: str, associate: bool = True) -> outcome.List[types.Key]:
+    async def __ensure(
+        self, keys_file_text: str, associate: bool = True, email_to_uid: dict[str, str] | None = None
+    ) -> outcome.List[types.Key]:
         outcomes = outcome.List[types.Key]()
         try:
-            ldap_data = await util.email_to_uid_map()
+            # Bulk imports pass in the map, so that LDAP is not searched once per committee
+            ldap_data = email_to_uid if (email_to_uid is not None) else await util.email_to_uid_map()
             key_blocks = util.parse_key_blocks(keys_file_text)
         except Exception as e:
             outcomes.append_error(e)
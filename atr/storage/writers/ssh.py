@@ -48,21 +48,29 @@ class FoundationCommitter(GeneralPublic):
         asf_uid = write.authorisation.asf_uid
         if asf_uid is None:
             raise storage.AccessError("No ASF UID")
-        self.__asf_uid = asf_uid
+        self._asf_uid = asf_uid
 
     async def add_key(self, key: str, asf_uid: str) -> str:
         fingerprint = util.key_ssh_fingerprint(key)
         self.__data.add(sql.SSHKey(fingerprint=fingerprint, key=key, asf_uid=asf_uid))
         await self.__data.commit()
+        self.__write_as.append_to_audit_log(
+            asf_uid=asf_uid,
+            fingerprint=fingerprint,
+        )
         return fingerprint
 
     async def delete_key(self, fingerprint: str) -> None:
         ssh_key = await self.__data.ssh_key(
             fingerprint=fingerprint,
-            asf_uid=self.__asf_uid,
+            asf_uid=self._asf_uid,
         ).demand(storage.AccessError(f"Key not found: {fingerprint}"))
         await self.__data.delete(ssh_key)
         await self.__data.commit()
+        self.__write_as.append_to_audit_log(
+            asf_uid=self._asf_uid,
+            fingerprint=fingerprint,
+        )
 
 
 class CommitteeParticipant(FoundationCommitter):
@@ -77,10 +85,6 @@ class CommitteeParticipant(FoundationCommitter):
         self.__write = write
         self.__write_as = write_as
         self.__data = data
-        asf_uid = write.authorisation.asf_uid
-        if asf_uid is None:
-            raise storage.AccessError("No ASF UID")
-        self.__asf_uid = asf_uid
         self.__committee_name = committee_name
 
     async def add_workflow_key(self, github_uid: str, github_nid: int, project_name: str, key: str) -> tuple[str, int]:
@@ -93,7 +97,7 @@ class CommitteeParticipant(FoundationCommitter):
             fingerprint=fingerprint,
             key=key,
             project_name=project_name,
-            asf_uid=self.__asf_uid,
+            asf_uid=self._asf_uid,
             github_uid=github_uid,
             github_nid=github_nid,
             expires=expires,
@@ -101,7 +105,7 @@ class CommitteeParticipant(FoundationCommitter):
         self.__data.add(wsk)
         await self.__data.commit()
         self.__write_as.append_to_audit_log(
-            asf_uid=self.__asf_uid,
+            asf_uid=self._asf_uid,
             fingerprint=fingerprint,
             project_name=project_name,
             github_uid=github_uid,
@@ -123,8 +127,4 @@ class CommitteeMember(CommitteeParticipant):
         self.__write = write
         self.__write_as = write_as
         self.__data = data
-        asf_uid = write.authorisation.asf_uid
-        if asf_uid is None:
-            raise storage.AccessError("No ASF UID")
-        self.__asf_uid = asf_uid
         self.__committee_name = committee_name
@@ -51,7 +51,7 @@ class FoundationCommitter(GeneralPublic):
         asf_uid = write.authorisation.asf_uid
         if asf_uid is None:
             raise storage.AccessError("No ASF UID")
-        self.__asf_uid = asf_uid
+        self._asf_uid = asf_uid
 
     async def add_token(
         self, uid: str, token_hash: str, created: datetime.datetime, expires: datetime.datetime, label: str | None
@@ -65,20 +65,29 @@ class FoundationCommitter(GeneralPublic):
         )
         self.__data.add(pat)
         await self.__data.commit()
+        self.__write_as.append_to_audit_log(
+            asf_uid=uid,
+            pat_hash=token_hash,
+            expires=expires.isoformat(),
+            label=label,
+        )
         return pat
 
     async def delete_token(self, token_id: int) -> None:
-        pat = await self.__data.query_one_or_none(
-            sqlmodel.select(sql.PersonalAccessToken).where(
-                sql.PersonalAccessToken.id == token_id,
-                sql.PersonalAccessToken.asfuid == self.__asf_uid,
+        via = sql.validate_instrumented_attribute
+        delete_result = await self.__data.execute(
+            sqlmodel.delete(sql.PersonalAccessToken)
+            .where(
+                via(sql.PersonalAccessToken.id) == token_id,
+                via(sql.PersonalAccessToken.asfuid) == self._asf_uid,
             )
+            .returning(via(sql.PersonalAccessToken.id))
         )
-        if pat is not None:
-            await self.__data.delete(pat)
-            await self.__data.commit()
+        deleted = delete_result.one_or_none()
+        await self.__data.commit()
+        if deleted is not None:
             self.__write_as.append_to_audit_log(
-                asf_uid=self.__asf_uid,
+                asf_uid=self._asf_uid,
                 token_id=token_id,
             )
 
@@ -86,19 +95,20 @@ class FoundationCommitter(GeneralPublic):
         pat_hash = hashlib.sha3_256(pat_text.encode()).hexdigest()
         pat = await self.__data.query_one_or_none(
             sqlmodel.select(sql.PersonalAccessToken).where(
-                sql.PersonalAccessToken.asfuid == self.__asf_uid,
+                sql.PersonalAccessToken.asfuid == self._asf_uid,
                 sql.PersonalAccessToken.token_hash == pat_hash,
             )
         )
         if pat is None:
             raise storage.AccessError("Invalid PAT")
-        if pat.expires < datetime.datetime.now(datetime.UTC):
+        now = datetime.datetime.now(datetime.UTC)
+        if pat.expires < now:
             raise storage.AccessError("Expired PAT")
-        issued_jwt = jwtoken.issue(self.__asf_uid)
-        pat.last_used = datetime.datetime.now(datetime.UTC)
+        issued_jwt = jwtoken.issue(self._asf_uid)
+        pat.last_used = now
         await self.__data.commit()
         self.__write_as.append_to_audit_log(
-            asf_uid=self.__asf_uid,
+            asf_uid=self._asf_uid,
             pat_hash=pat_hash,
         )
         return issued_jwt
@@ -116,10 +126,6 @@ class CommitteeParticipant(FoundationCommitter):
         self.__write = write
         self.__write_as = write_as
         self.__data = data
-        asf_uid = write.authorisation.asf_uid
-        if asf_uid is None:
-            raise storage.AccessError("No ASF UID")
-        self.__asf_uid = asf_uid
         self.__committee_name = committee_name
 
 
@@ -135,8 +141,4 @@ class CommitteeMember(CommitteeParticipant):
         self.__write = write
         self.__write_as = write_as
         self.__data = data
-        asf_uid = write.authorisation.asf_uid
-        if asf_uid is None:
-            raise storage.AccessError("No ASF UID")
-        self.__asf_uid = asf_uid
         self.__committee_name = committee_name
@@ -104,9 +104,10 @@ async def _run_svn_info(path_or_url: str) -> str:
     return await _run_svn_command("info", path_or_url)
 
 
-async def update(path: pathlib.Path) -> str:
-    log.debug(f"running svn update for '{path}'")
-    return await _run_svn_command("update", str(path), "--parents")
+async def update(*paths: pathlib.Path) -> str:
+    path_strs = [str(path) for path in paths]
+    log.debug(f"running svn update for {path_strs}")
+    return await run_command("svn", "update", "--parents", *path_strs)
 
 
 async def get_log(path: pathlib.Path) -> SvnLog:
@@ -29,11 +29,14 @@ import atr.svn as svn
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+_UPDATE_BATCH_SIZE: Final[int] = 256
+
 # TODO: Check that these prefixes are correct
 _WATCHED_PREFIXES: Final[tuple[str, ...]] = (
     "/svn/dist/dev",
     "/svn/dist/release",
 )
+_WATCHED_PREFIX_LENGTHS: Final[tuple[tuple[str, int], ...]] = tuple((p, len(p)) for p in _WATCHED_PREFIXES)
 
 
 class SVNListener:
@@ -110,14 +113,27 @@ class SVNListener:
               ...
             }
         """
-        changed: Sequence[str] = payload.get("commit", {}).get("changed", [])
-        for repo_path in changed:
-            prefix = next((p for p in _WATCHED_PREFIXES if repo_path.startswith(p)), "")
-            if not prefix:
-                continue
-            local_path = self.working_copy_root / repo_path[len(prefix) :].lstrip("/")
+        changed: Sequence[str] = (payload.get("commit") or {}).get("changed") or ()
+        if not changed:
+            return
+        watched_paths = (_watched_relative_path(repo_path) for repo_path in changed)
+        # Deduplicate while preserving order, so that each path is updated once
+        local_paths = list(dict.fromkeys(self.working_copy_root / p for p in watched_paths if p is not None))
+        if not local_paths:
+            log.debug("No watched paths changed in PubSub payload")
+            return
+        # Pass many targets to each svn update rather than spawning one process per path
+        for i in range(0, len(local_paths), _UPDATE_BATCH_SIZE):
+            batch = local_paths[i : i + _UPDATE_BATCH_SIZE]
             try:
-                await svn.update(local_path)
-                log.info(f"svn updated {local_path}")
+                await svn.update(*batch)
+                log.info(f"svn updated {len(batch)} paths, starting with {batch[0]}")
             except Exception as exc:
-                log.warning(f"failed svn update {local_path}: {exc}")
+                log.warning(f"failed svn update of {len(batch)} paths, starting with {batch[0]}: {exc}")
+
+
+def _watched_relative_path(repo_path: str) -> str | None:
+    for prefix, prefix_length in _WATCHED_PREFIX_LENGTHS:
+        if repo_path.startswith(prefix):
+            return repo_path[prefix_length:].lstrip("/")
+    return None
@@ -16,7 +16,8 @@
 # under the License.
 
 import datetime
-from collections.abc import Awaitable, Callable, Coroutine
+import functools
+from collections.abc import Awaitable, Callable, Coroutine, Set
 from typing import Any, Final
 
 import sqlmodel
@@ -88,6 +89,7 @@ async def draft_checks(
     # We don't have the release object here, so we can't use util.release_directory
     revision_path = util.get_unfinished_dir() / project_name / release_version / revision_number
     relative_paths = [path async for path in util.paths_recursive(revision_path)]
+    revision_paths = frozenset(str(path) for path in relative_paths)
 
     async with db.ensure_session(caller_data) as data:
         release = await data.release(name=sql.release_name(project_name, release_version), _committee=True).demand(
@@ -107,11 +109,7 @@ async def draft_checks(
         )
         for path in relative_paths:
             path_str = str(path)
-            task_function: Callable[[str, sql.Release, str, str], Awaitable[list[sql.Task]]] | None = None
-            for suffix, func in TASK_FUNCTIONS.items():
-                if path.name.endswith(suffix):
-                    task_function = func
-                    break
+            task_function = _task_function(path.name, revision_paths)
             if task_function:
                 for task in await task_function(asf_uid, release, revision_number, path_str):
                     task.revision_number = revision_number
@@ -270,11 +268,33 @@ def resolve(task_type: sql.TaskType) -> Callable[..., Awaitable[results.Results
         # Otherwise we lose exhaustiveness checking
 
 
-async def sha_checks(asf_uid: str, release: sql.Release, revision: str, hash_file: str) -> list[sql.Task]:
-    """Create hash check task for a .sha256 or .sha512 file."""
+async def sha_checks(
+    asf_uid: str, release: sql.Release, revision: str, hash_file: str, revision_paths: Set[str] = frozenset()
+) -> list[sql.Task]:
+    """Create hash check task for a .sha256 or .sha512 file.
+
+    When both digests of an artifact are in revision_paths, the .sha256 task
+    checks the .sha512 file too, so the artifact is only read once.
+    """
     tasks = []
 
-    tasks.append(queued(asf_uid, sql.TaskType.HASHING_CHECK, release, revision, hash_file))
+    artifact_path, _, algorithm = hash_file.rpartition(".")
+    sibling_algorithm = "sha512" if (algorithm == "sha256") else "sha256"
+    sibling_rel_path = f"{artifact_path}.{sibling_algorithm}"
+    if sibling_rel_path not in revision_paths:
+        tasks.append(queued(asf_uid, sql.TaskType.HASHING_CHECK, release, revision, hash_file))
+    elif algorithm == "sha256":
+        tasks.append(
+            queued(
+                asf_uid,
+                sql.TaskType.HASHING_CHECK,
+                release,
+                revision,
+                hash_file,
+                extra_args={"sibling_rel_path": sibling_rel_path},
+            )
+        )
+    # Otherwise this is a .sha512 file, which the task for its .sha256 sibling checks
 
     return tasks
 
@@ -335,6 +355,18 @@ async def zip_checks(asf_uid: str, release: sql.Release, revision: str, path: st
     return tasks
 
 
+def _task_function(
+    path_name: str, revision_paths: Set[str]
+) -> Callable[[str, sql.Release, str, str], Awaitable[list[sql.Task]]] | None:
+    for suffix, func in TASK_FUNCTIONS.items():
+        if path_name.endswith(suffix):
+            if func is sha_checks:
+                # Hash files are paired with their siblings, so they need the full path list
+                return functools.partial(sha_checks, revision_paths=revision_paths)
+            return func
+    return None
+
+
 TASK_FUNCTIONS: Final[dict[str, Callable[..., Coroutine[Any, Any, list[sql.Task]]]]] = {
     ".asc": asc_checks,
     ".sha256": sha_checks,
@@ -29,7 +29,7 @@ import blake3
 import sqlmodel
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Sequence
 
     import atr.models.schema as schema
 
@@ -115,6 +115,24 @@ class Recorder:
         data: Any,
         primary_rel_path: str | None = None,
         member_rel_path: str | None = None,
+    ) -> sql.CheckResult:
+        result = self._result(status, message, data, primary_rel_path, member_rel_path)
+
+        # It would be more efficient to keep a session open
+        # But, we prefer in this case to maintain a simpler interface
+        # If performance is unacceptable, we can revisit this design
+        async with db.session() as session:
+            session.add(result)
+            await session.commit()
+        return result
+
+    def _result(
+        self,
+        status: sql.CheckResultStatus,
+        message: str,
+        data: Any,
+        primary_rel_path: str | None = None,
+        member_rel_path: str | None = None,
     ) -> sql.CheckResult:
         if self.constructed is False:
             raise RuntimeError("Cannot add check result to a recorder that has not been constructed")
@@ -129,7 +147,7 @@ class Recorder:
             if status != sql.CheckResultStatus.SUCCESS:
                 self.member_problems[status] = self.member_problems.get(status, 0) + 1
 
-        result = sql.CheckResult(
+        return sql.CheckResult(
             release_name=self.release_name,
             revision_number=self.revision_number,
             checker=self.checker,
@@ -142,14 +160,6 @@ class Recorder:
             input_hash=self.__input_hash,
         )
 
-        # It would be more efficient to keep a session open
-        # But, we prefer in this case to maintain a simpler interface
-        # If performance is unacceptable, we can revisit this design
-        async with db.session() as session:
-            session.add(result)
-            await session.commit()
-        return result
-
     async def abs_path(self, rel_path: str | None = None) -> pathlib.Path | None:
         """Construct the absolute path using the required revision."""
         # Determine the relative path part
@@ -291,6 +301,21 @@ class Recorder:
             member_rel_path=member_rel_path,
         )
 
+    async def record_many(
+        self, items: Sequence[tuple[sql.CheckResultStatus, str, Any, str | None]]
+    ) -> list[sql.CheckResult]:
+        """Add (status, message, data, primary_rel_path) check results in a single transaction."""
+        check_results = [
+            self._result(status, message, data, primary_rel_path=primary_rel_path)
+            for status, message, data, primary_rel_path in items
+        ]
+        if not check_results:
+            return check_results
+        async with db.session() as session:
+            session.add_all(check_results)
+            await session.commit()
+        return check_results
+
     async def success(
         self, message: str, data: Any, primary_rel_path: str | None = None, member_rel_path: str | None = None
     ) -> sql.CheckResult:
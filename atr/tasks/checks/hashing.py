@@ -15,8 +15,12 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import asyncio
 import hashlib
+import pathlib
 import secrets
+import threading
+from typing import Final
 
 import aiofiles
 
@@ -24,17 +28,39 @@ import atr.log as log
 import atr.models.results as results
 import atr.tasks.checks as checks
 
+_ALGORITHMS: Final = {"sha256": hashlib.sha256, "sha512": hashlib.sha512}
+# Hash files are normally one short line, and even multi-line formats are tiny
+_HASH_FILE_MAX_CHARS: Final[int] = 64 * 1024
+_READ_BUFFER_SIZE: Final[int] = 1024 * 1024
+_THREAD_LOCAL: Final = threading.local()
+
 
 async def check(args: checks.FunctionArguments) -> results.Results | None:
-    """Check the hash of a file."""
+    """Check the hash of a file, and of its sibling hash file if one was queued with it."""
     recorder = await args.recorder()
     if not (hash_abs_path := await recorder.abs_path()):
         return None
 
     algorithm = hash_abs_path.suffix.lstrip(".")
-    if algorithm not in {"sha256", "sha512"}:
+    if algorithm not in _ALGORITHMS:
         await recorder.failure("Unsupported hash algorithm", {"algorithm": algorithm})
         return None
+    sidecars = [(algorithm, hash_abs_path, recorder)]
+
+    # When both .sha256 and .sha512 exist, one task checks both so that the artifact is read only once
+    sibling_rel_path = args.extra_args.get("sibling_rel_path")
+    if isinstance(sibling_rel_path, str):
+        sibling_recorder = await checks.Recorder.create(
+            checker=check,
+            project_name=args.project_name,
+            version_name=args.version_name,
+            revision_number=args.revision_number,
+            primary_rel_path=sibling_rel_path,
+        )
+        if sibling_abs_path := await sibling_recorder.abs_path():
+            sibling_algorithm = sibling_abs_path.suffix.lstrip(".")
+            if sibling_algorithm in _ALGORITHMS:
+                sidecars.append((sibling_algorithm, sibling_abs_path, sibling_recorder))
 
     # Remove the hash file suffix to get the artifact path
     # This replaces the last suffix, which is what we want
@@ -44,32 +70,53 @@ async def check(args: checks.FunctionArguments) -> results.Results | None:
     # PosixPath('a/b/c.d.e.f')
     artifact_abs_path = hash_abs_path.with_suffix("")
 
-    log.info(
-        f"Checking hash ({algorithm}) for {artifact_abs_path} against {hash_abs_path} (rel: {args.primary_rel_path})"
-    )
+    for sidecar_algorithm, sidecar_abs_path, sidecar_recorder in sidecars:
+        log.info(
+            f"Checking hash ({sidecar_algorithm}) for {artifact_abs_path} against {sidecar_abs_path}"
+            f" (rel: {sidecar_recorder.primary_rel_path})"
+        )
 
-    hash_func = hashlib.sha256 if (algorithm == "sha256") else hashlib.sha512
-    hash_obj = hash_func()
     try:
-        async with aiofiles.open(artifact_abs_path, mode="rb") as f:
-            while chunk := await f.read(4096):
-                hash_obj.update(chunk)
-        computed_hash = hash_obj.hexdigest()
+        computed_digests = await _compute_hashes(artifact_abs_path, [a for a, _p, _r in sidecars])
+    except Exception as e:
+        for _sidecar_algorithm, _sidecar_abs_path, sidecar_recorder in sidecars:
+            await sidecar_recorder.failure("Unable to verify hash", {"error": str(e)})
+        return None
 
+    for sidecar_algorithm, sidecar_abs_path, sidecar_recorder in sidecars:
+        await _check_sidecar(
+            sidecar_recorder,
+            sidecar_algorithm,
+            sidecar_abs_path,
+            artifact_abs_path,
+            computed_digests[sidecar_algorithm],
+        )
+    return None
+
+
+async def _check_sidecar(
+    recorder: checks.Recorder,
+    algorithm: str,
+    hash_abs_path: pathlib.Path,
+    artifact_abs_path: pathlib.Path,
+    computed_digest: bytes,
+) -> None:
+    computed_hash = computed_digest.hex()
+    try:
         async with aiofiles.open(hash_abs_path) as f:
-            expected_hash = await f.read()
+            expected_hash = await f.read(_HASH_FILE_MAX_CHARS)
         # May be in the format "HASH FILENAME\n"
         artifact_name = artifact_abs_path.name
         if expected_hash.startswith(artifact_name):
             # Fineract use the format "FILENAME: HASH HASH\n   HASH HASH\n..."
             expected_hash = expected_hash.removeprefix(artifact_name + ":")
-            expected_hash = expected_hash.replace(" ", "").replace("\n", "")
+            expected_hash = "".join(expected_hash.split())
         else:
             # TODO: Check the FILENAME part
             expected_hash = expected_hash.strip().split()[0]
         expected_hash = expected_hash.lower()
 
-        if secrets.compare_digest(computed_hash, expected_hash):
+        if _digest_matches(computed_digest, expected_hash):
             await recorder.success(
                 f"Hash ({algorithm}) matches expected value",
                 {"computed_hash": computed_hash, "expected_hash": expected_hash},
@@ -81,4 +128,36 @@ async def check(args: checks.FunctionArguments) -> results.Results | None:
             )
     except Exception as e:
         await recorder.failure("Unable to verify hash", {"error": str(e)})
-    return None
+
+
+async def _compute_hashes(artifact_abs_path: pathlib.Path, algorithms: list[str]) -> dict[str, bytes]:
+    # The hashlib update method releases the GIL for large inputs, so this runs well in a thread
+    return await asyncio.to_thread(_compute_hashes_sync, artifact_abs_path, algorithms)
+
+
+def _compute_hashes_sync(artifact_abs_path: pathlib.Path, algorithms: list[str]) -> dict[str, bytes]:
+    hash_objs = {algorithm: _ALGORITHMS[algorithm]() for algorithm in algorithms}
+    buffer = _read_buffer()
+    with memoryview(buffer) as view, open(artifact_abs_path, "rb", buffering=0) as f:
+        while size := f.readinto(buffer):
+            for hash_obj in hash_objs.values():
+                hash_obj.update(view[:size])
+    return {algorithm: hash_obj.digest() for algorithm, hash_obj in hash_objs.items()}
+
+
+def _digest_matches(computed_digest: bytes, expected_hash: str) -> bool:
+    # Compare raw digests, which are half the length of their hex forms
+    try:
+        expected_digest = bytes.fromhex(expected_hash)
+    except ValueError:
+        return False
+    return secrets.compare_digest(computed_digest, expected_digest)
+
+
+def _read_buffer() -> bytearray:
+    # Executor threads are reused, so each keeps one buffer for all of the artifacts that it hashes
+    buffer = getattr(_THREAD_LOCAL, "buffer", None)
+    if buffer is None:
+        buffer = bytearray(_READ_BUFFER_SIZE)
+        _THREAD_LOCAL.buffer = buffer
+    return buffer
@@ -18,10 +18,11 @@
 import asyncio
 import difflib
 import hashlib
+import itertools
 import os
 import pathlib
 import re
-from collections.abc import Iterator
+from collections.abc import AsyncGenerator, Iterator
 from typing import Any, Final
 
 import atr.constants as constants
@@ -79,6 +80,17 @@ INCLUDED_PATTERNS: Final[list[str]] = [
     r"\.(pl|pm|t)$",  # Perl
 ]
 
+# Number of results to take from a core logic generator per worker thread hop
+_RESULT_BATCH_SIZE: Final[int] = 256
+
+_HEADERS_LOWER: Final[frozenset[bytes]] = frozenset(
+    {HTTP_APACHE_LICENSE_HEADER.lower(), HTTPS_APACHE_LICENSE_HEADER.lower()}
+)
+_HEADER_SPAN: Final = re.compile(rb"Licensed to the.*?under the License", re.MULTILINE)
+_HEADER_WHITESPACE: Final = re.compile(rb"[ \t\r\n]+")
+_HEADER_WORDS: Final = re.compile(rb"[A-Za-z0-9]+")
+_INCLUDED: Final = re.compile("|".join(f"(?:{pattern})" for pattern in INCLUDED_PATTERNS), re.IGNORECASE)
+
 # Types
 
 
@@ -138,7 +150,7 @@ async def files(args: checks.FunctionArguments) -> results.Results | None:
 
     try:
         is_podling = args.extra_args.get("is_podling", False)
-        for result in await asyncio.to_thread(_files_check_core_logic, str(artifact_abs_path), is_podling):
+        async for result in _in_thread(_files_check_core_logic(str(artifact_abs_path), is_podling)):
             match result:
                 case ArtifactResult():
                     await _record_artifact(recorder, result)
@@ -196,20 +208,15 @@ def headers_validate(content: bytes, _filename: str) -> tuple[bool, str | None]:
         if pattern in content:
             return True, None
 
-    r_span = re.compile(rb"Licensed to the.*?under the License", re.MULTILINE)
-    r_words = re.compile(rb"[A-Za-z0-9]+")
-
     # Normalise the content
-    content = re.sub(rb"[ \t\r\n]+", b" ", content)
+    content = _HEADER_WHITESPACE.sub(b" ", content)
 
     # For each matching heuristic span...
-    for span in r_span.finditer(content):
+    for span in _HEADER_SPAN.finditer(content):
         # Get only the words in the span
-        words = r_words.findall(span.group(0))
+        words = _HEADER_WORDS.findall(span.group(0))
         joined = b" ".join(words).lower()
-        if joined == HTTP_APACHE_LICENSE_HEADER.lower():
-            return True, None
-        elif joined == HTTPS_APACHE_LICENSE_HEADER.lower():
+        if joined in _HEADERS_LOWER:
             return True, None
     return False, "Could not find Apache License header"
 
@@ -339,6 +346,8 @@ def _headers_check_core_logic(artifact_path: str, ignore_lines: list[str], exclu
 
     artifact_basename = os.path.basename(artifact_path)
     # log.info(f"Ignore lines: {ignore_lines}")
+    # The rules do not depend on the member, so parse them once for the whole archive
+    matcher = util.create_path_matcher(ignore_lines, pathlib.Path("/" + artifact_basename), pathlib.Path("/"))
 
     # Check files in the archive
     with tarzip.open_archive(artifact_path) as archive:
@@ -348,7 +357,6 @@ def _headers_check_core_logic(artifact_path: str, ignore_lines: list[str], exclu
                 continue
 
             ignore_path = "/" + artifact_basename + "/" + member.name.lstrip("/")
-            matcher = util.create_path_matcher(ignore_lines, pathlib.Path(ignore_path), pathlib.Path("/"))
             # log.info(f"Checking {ignore_path} with matcher {matcher}")
             if matcher(ignore_path):
                 # log.info(f"Skipping {ignore_path} because it matches the ignore list")
@@ -446,20 +454,15 @@ def _headers_check_core_logic_should_check(filepath: str) -> bool:
         return False
 
     # Then check if the file matches any of our included patterns
-    for pattern in INCLUDED_PATTERNS:
-        if re.search(pattern, filepath, re.IGNORECASE):
-            return True
-
-    return False
+    return _INCLUDED.search(filepath) is not None
 
 
 async def _headers_core(
     recorder: checks.Recorder, artifact_abs_path: str, ignore_lines: list[str], excludes_source: str
 ) -> None:
     try:
-        for result in await asyncio.to_thread(
-            _headers_check_core_logic, str(artifact_abs_path), ignore_lines, excludes_source
-        ):
+        results_iter = _headers_check_core_logic(str(artifact_abs_path), ignore_lines, excludes_source)
+        async for result in _in_thread(results_iter):
             match result:
                 case ArtifactResult():
                     await _record_artifact(recorder, result)
@@ -480,6 +483,13 @@ async def _headers_core(
     return None
 
 
+async def _in_thread(results_iter: Iterator[Result]) -> AsyncGenerator[Result]:
+    # Calling a generator function in a thread only creates the generator, so advance it there instead
+    while batch := await asyncio.to_thread(_next_batch, results_iter):
+        for result in batch:
+            yield result
+
+
 def _license_results(
     license_results: dict[str, str | None],
 ) -> Iterator[Result]:
@@ -517,6 +527,10 @@ def _license_results(
             )
 
 
+def _next_batch(results_iter: Iterator[Result]) -> list[Result]:
+    return list(itertools.islice(results_iter, _RESULT_BATCH_SIZE))
+
+
 def _normal_whitespace(lines: list[str]) -> list[str]:
     result = []
     for line in lines:
@@ -16,18 +16,22 @@
 # under the License.
 
 import asyncio
+import collections
+import contextlib
+import functools
+import os
 import pathlib
 import re
-from typing import Final
+from typing import Any, Final
 
 import aiofiles.os
 
 import atr.analysis as analysis
 import atr.log as log
 import atr.models.results as results
+import atr.models.sql as sql
 import atr.tasks.checks as checks
 import atr.user as user
-import atr.util as util
 
 _ALLOWED_TOP_LEVEL: Final = frozenset(
     {
@@ -37,6 +41,23 @@ _ALLOWED_TOP_LEVEL: Final = frozenset(
         "README",
     }
 )
+_EMPTY_SUFFIXES: Final[frozenset[str]] = frozenset()
+_EXTENSION_PATTERN: Final = re.compile(analysis.extension_pattern())
+# Whether use of the suffix is an error, and the message to give
+_METADATA_SUFFIX_RULES: Final[dict[str, tuple[bool, str]]] = {
+    # Forbidden by RCP, deprecated by RDP
+    ".md5": (True, "The use of .md5 is forbidden, please use .sha512"),
+    # Deprecated by RDP
+    ".sha1": (False, "The use of .sha1 is deprecated, please use .sha512"),
+    # Discouraged by RDP
+    ".sha": (False, "The use of .sha is discouraged, please use .sha512"),
+    # Forbidden by RCP, forbidden by RDP
+    ".sig": (True, "Binary signature files (.sig) are forbidden, please use .asc"),
+}
+_NAMED_METADATA_EXTENSIONS: Final = frozenset({".asc", ".cdx.json", ".sha256", ".sha512", ".md5", ".sha", ".sha1"})
+# The signature and checksum files that artifacts are required to have
+_REQUIRED_METADATA_SUFFIXES: Final[tuple[str, ...]] = (".asc", ".sha256", ".sha512")
+_SUCCESS_MESSAGE: Final[str] = "Path structure and naming conventions conform to policy"
 
 
 async def check(args: checks.FunctionArguments) -> results.Results | None:
@@ -49,30 +70,18 @@ async def check(args: checks.FunctionArguments) -> results.Results | None:
     # - Incubation Policy (IP)
     # https://incubator.apache.org/policy/incubation.html
 
-    recorder_errors = await checks.Recorder.create(
-        checker=checks.function_key(check) + "_errors",
-        project_name=args.project_name,
-        version_name=args.version_name,
-        revision_number=args.revision_number,
-        primary_rel_path=None,
-        afresh=True,
-    )
-    recorder_warnings = await checks.Recorder.create(
-        checker=checks.function_key(check) + "_warnings",
-        project_name=args.project_name,
-        version_name=args.version_name,
-        revision_number=args.revision_number,
-        primary_rel_path=None,
-        afresh=True,
-    )
-    recorder_success = await checks.Recorder.create(
-        checker=checks.function_key(check) + "_success",
-        project_name=args.project_name,
-        version_name=args.version_name,
-        revision_number=args.revision_number,
-        primary_rel_path=None,
-        afresh=True,
-    )
+    # Each recorder clears its old results, and SQLite allows only one writer at a time
+    recorder_errors, recorder_warnings, recorder_success = [
+        await checks.Recorder.create(
+            checker=checks.function_key(check) + suffix,
+            project_name=args.project_name,
+            version_name=args.version_name,
+            revision_number=args.revision_number,
+            primary_rel_path=None,
+            afresh=True,
+        )
+        for suffix in ("_errors", "_warnings", "_success")
+    ]
 
     # As primary_rel_path is None, the base path is the release candidate draft directory
     if not (base_path := await recorder_success.abs_path()):
@@ -83,103 +92,86 @@ async def check(args: checks.FunctionArguments) -> results.Results | None:
         return
 
     is_podling = args.extra_args.get("is_podling", False)
-    relative_paths = [p async for p in util.paths_recursive(base_path)]
-    relative_paths_set = set(str(p) for p in relative_paths)
-    for relative_path in relative_paths:
-        # Delegate processing of each path to the helper function
-        await _check_path_process_single(
-            args.asf_uid,
-            base_path,
-            relative_path,
-            recorder_errors,
-            recorder_warnings,
-            recorder_success,
-            relative_paths_set,
-            is_podling,
+    is_admin = user.is_admin(args.asf_uid)
+    relative_paths = await asyncio.to_thread(_relative_file_paths, base_path)
+    metadata_index = _metadata_index(relative_paths)
+
+    error_items: list[tuple[sql.CheckResultStatus, str, Any, str | None]] = []
+    warning_items: list[tuple[sql.CheckResultStatus, str, Any, str | None]] = []
+    success_items: list[tuple[sql.CheckResultStatus, str, Any, str | None]] = []
+    for relative_path_str in relative_paths:
+        errors, warnings = await _check_path_process_single(
+            is_admin, relative_path_str, relative_paths, metadata_index, is_podling
         )
+        if not (errors or warnings):
+            success_items.append((sql.CheckResultStatus.SUCCESS, _SUCCESS_MESSAGE, {}, relative_path_str))
+            continue
+        error_items.extend((sql.CheckResultStatus.FAILURE, error, {}, relative_path_str) for error in errors)
+        warning_items.extend((sql.CheckResultStatus.WARNING, warning, {}, relative_path_str) for warning in warnings)
 
+    log.info(
+        f"Checked {len(relative_paths)} paths in {base_path}: {len(error_items)} errors, {len(warning_items)} warnings"
+    )
+
+    # Each recorder writes all of its results in a single transaction, one recorder at a time
+    await recorder_errors.record_many(error_items)
+    await recorder_warnings.record_many(warning_items)
+    await recorder_success.record_many(success_items)
     return None
 
 
-async def _check_artifact_rules(
-    base_path: pathlib.Path, relative_path: pathlib.Path, relative_paths: set[str], errors: list[str], is_podling: bool
+def _check_artifact_rules(
+    relative_path_str: str, name: str, metadata_suffixes: frozenset[str], errors: list[str], is_podling: bool
 ) -> None:
     """Check rules specific to artifact files."""
-    full_path = base_path / relative_path
-
     # RDP says that .asc is required
-    asc_path = full_path.with_suffix(full_path.suffix + ".asc")
-    if not await aiofiles.os.path.exists(asc_path):
-        errors.append(f"Missing corresponding signature file ({relative_path}.asc)")
+    if ".asc" not in metadata_suffixes:
+        errors.append(f"Missing corresponding signature file ({relative_path_str}.asc)")
 
     # RDP requires one of .sha256 or .sha512
-    relative_sha256_path = relative_path.with_suffix(relative_path.suffix + ".sha256")
-    relative_sha512_path = relative_path.with_suffix(relative_path.suffix + ".sha512")
-    has_sha256 = str(relative_sha256_path) in relative_paths
-    has_sha512 = str(relative_sha512_path) in relative_paths
+    has_sha256 = ".sha256" in metadata_suffixes
+    has_sha512 = ".sha512" in metadata_suffixes
     if not (has_sha256 or has_sha512):
-        errors.append(f"Missing corresponding checksum file ({relative_path}.sha256 or {relative_path}.sha512)")
+        errors.append(f"Missing corresponding checksum file ({relative_path_str}.sha256 or {relative_path_str}.sha512)")
 
     # IP requires "incubating" in the filename
     if is_podling is True:
         # TODO: Allow "incubator" too as #114 requests?
-        if "incubating" not in full_path.name:
+        if "incubating" not in name:
             errors.append("Podling artifact filenames must include 'incubating'")
 
 
-async def _check_metadata_rules(
-    _base_path: pathlib.Path,
-    relative_path: pathlib.Path,
+def _check_metadata_rules(
+    relative_path_str: str,
     relative_paths: set[str],
     ext_metadata: str,
     errors: list[str],
     warnings: list[str],
 ) -> None:
     """Check rules specific to metadata files (.asc, .sha*, etc.)."""
-    suffixes = set(relative_path.suffixes)
-
-    if ".md5" in suffixes:
-        # Forbidden by RCP, deprecated by RDP
-        errors.append("The use of .md5 is forbidden, please use .sha512")
-    if ".sha1" in suffixes:
-        # Deprecated by RDP
-        warnings.append("The use of .sha1 is deprecated, please use .sha512")
-    if ".sha" in suffixes:
-        # Discouraged by RDP
-        warnings.append("The use of .sha is discouraged, please use .sha512")
-    if ".sig" in suffixes:
-        # Forbidden by RCP, forbidden by RDP
-        errors.append("Binary signature files (.sig) are forbidden, please use .asc")
-
-    # "Signature and checksum files for verifying distributed artifacts should
-    # not be provided, unless named as indicated above." (RDP)
-    # Also .mds is allowed, but we'll ignore that for now
-    # TODO: Is .mds supported in analysis.METADATA_SUFFIXES?
-    if ext_metadata not in {".asc", ".cdx.json", ".sha256", ".sha512", ".md5", ".sha", ".sha1"}:
-        warnings.append("The use of this metadata file is discouraged")
+    metadata_errors, metadata_warnings = _metadata_findings(ext_metadata)
+    errors.extend(metadata_errors)
+    warnings.extend(metadata_warnings)
 
     # Check whether the corresponding artifact exists
-    artifact_path_base = str(relative_path).removesuffix(ext_metadata)
+    artifact_path_base = relative_path_str.removesuffix(ext_metadata)
     if artifact_path_base not in relative_paths:
         errors.append(f"Metadata file exists but corresponding artifact '{artifact_path_base}' is missing")
 
 
 async def _check_path_process_single(
-    asf_uid: str,
-    base_path: pathlib.Path,
-    relative_path: pathlib.Path,
-    recorder_errors: checks.Recorder,
-    recorder_warnings: checks.Recorder,
-    recorder_success: checks.Recorder,
+    is_admin: bool,
+    relative_path_str: str,
     relative_paths: set[str],
+    metadata_index: dict[str, frozenset[str]],
     is_podling: bool,
-) -> None:
+) -> tuple[list[str], list[str]]:
     """Process and check a single path within the release directory."""
-    full_path = base_path / relative_path
-    relative_path_str = str(relative_path)
+    parts = relative_path_str.split("/")
+    name = parts[-1]
 
     # For debugging and testing
-    if user.is_admin(asf_uid) and (full_path.name == "deliberately_slow_ATR_task_filename.txt"):
+    if is_admin and (name == "deliberately_slow_ATR_task_filename.txt"):
         await asyncio.sleep(20)
 
     errors: list[str] = []
@@ -187,56 +179,82 @@ async def _check_path_process_single(
 
     # The Release Distribution Policy specifically allows README and CHANGES, etc.
     # We assume that LICENSE and NOTICE are permitted also
-    if relative_path.name == "KEYS":
+    if name == "KEYS":
         errors.append("The KEYS file should be uploaded via the 'Keys' section, not included in the artifact bundle")
-    if any(part.startswith(".") for part in relative_path.parts):
+    if relative_path_str.startswith(".") or ("/." in relative_path_str):
         # TODO: There is not a a policy for this
         # We should enquire as to whether such a policy should be instituted
         # We're forbidding dotfiles to catch accidental uploads of e.g. .git or .htaccess
         # Such cases are likely to be in error, and could carry security risks
         # We allow .atr/ files, e.g. .atr/license-headers-ignore
-        if relative_path.parts[0] != ".atr":
+        if parts[0] != ".atr":
             errors.append("Dotfiles are forbidden")
 
-    search = re.search(analysis.extension_pattern(), relative_path_str)
+    search = _EXTENSION_PATTERN.search(relative_path_str)
     ext_artifact = search.group("artifact") if search else None
     ext_metadata = search.group("metadata") if search else None
 
     allowed_top_level = _ALLOWED_TOP_LEVEL
     if ext_artifact:
-        log.info(f"Checking artifact rules for {full_path}")
-        await _check_artifact_rules(base_path, relative_path, relative_paths, errors, is_podling)
+        metadata_suffixes = metadata_index.get(relative_path_str, _EMPTY_SUFFIXES)
+        _check_artifact_rules(relative_path_str, name, metadata_suffixes, errors, is_podling)
     elif ext_metadata:
-        log.info(f"Checking metadata rules for {full_path}")
-        await _check_metadata_rules(base_path, relative_path, relative_paths, ext_metadata, errors, warnings)
+        _check_metadata_rules(relative_path_str, relative_paths, ext_metadata, errors, warnings)
     else:
-        log.info(f"Checking general rules for {full_path}")
-        if (relative_path.parent == pathlib.Path(".")) and (relative_path.name not in allowed_top_level):
-            warnings.append(f"Unknown top level file: {relative_path.name}")
-
-    await _record(
-        recorder_errors,
-        recorder_warnings,
-        recorder_success,
-        relative_path_str,
-        errors,
-        warnings,
-    )
+        if (len(parts) == 1) and (name not in allowed_top_level):
+            warnings.append(f"Unknown top level file: {name}")
 
+    return errors, warnings
 
-async def _record(
-    recorder_errors: checks.Recorder,
-    recorder_warnings: checks.Recorder,
-    recorder_success: checks.Recorder,
-    relative_path_str: str,
-    errors: list[str],
-    warnings: list[str],
-) -> None:
-    for error in errors:
-        await recorder_errors.failure(error, {}, primary_rel_path=relative_path_str)
-    for warning in warnings:
-        await recorder_warnings.warning(warning, {}, primary_rel_path=relative_path_str)
-    if not (errors or warnings):
-        await recorder_success.success(
-            "Path structure and naming conventions conform to policy", {}, primary_rel_path=relative_path_str
-        )
+
+@functools.cache
+def _metadata_findings(ext_metadata: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Return the errors and warnings for a metadata file extension."""
+    errors: list[str] = []
+    warnings: list[str] = []
+    suffixes = {"." + suffix for suffix in ext_metadata.split(".")[1:]}
+    for suffix, (is_error, message) in _METADATA_SUFFIX_RULES.items():
+        if suffix in suffixes:
+            (errors if is_error else warnings).append(message)
+
+    # "Signature and checksum files for verifying distributed artifacts should
+    # not be provided, unless named as indicated above." (RDP)
+    # Also .mds is allowed, but we'll ignore that for now
+    # TODO: Is .mds supported in analysis.METADATA_SUFFIXES?
+    if ext_metadata not in _NAMED_METADATA_EXTENSIONS:
+        warnings.append("The use of this metadata file is discouraged")
+    return tuple(errors), tuple(warnings)
+
+
+def _metadata_index(relative_paths: set[str]) -> dict[str, frozenset[str]]:
+    """Map each path to the required metadata suffixes of its sibling files."""
+    index: dict[str, set[str]] = {}
+    for relative_path_str in relative_paths:
+        for suffix in _REQUIRED_METADATA_SUFFIXES:
+            if relative_path_str.endswith(suffix):
+                index.setdefault(relative_path_str.removesuffix(suffix), set()).add(suffix)
+                break
+    return {base: frozenset(suffixes) for base, suffixes in index.items()}
+
+
+def _relative_file_paths(base_path: pathlib.Path) -> set[str]:
+    """Return all file paths within a base path, relative to the base path, following symlinks."""
+    relative_paths: set[str] = set()
+    visited: set[str] = set()
+    # Breadth first, as in util.paths_recursive, so that the shallowest path to a directory is used
+    pending: collections.deque[tuple[str, str]] = collections.deque([(os.fspath(base_path), "")])
+    while pending:
+        abs_dir, rel_dir = pending.popleft()
+        real_dir = os.path.realpath(abs_dir)
+        if real_dir in visited:
+            continue
+        visited.add(real_dir)
+        with contextlib.suppress(OSError), os.scandir(abs_dir) as entries:
+            for entry in entries:
+                rel_path = rel_dir + entry.name
+                # These use the type from the directory listing, so only symlinks need a stat
+                if entry.is_dir():
+                    pending.append((entry.path, rel_path + "/"))
+                elif entry.is_file():
+                    relative_paths.add(rel_path)
+    return relative_paths
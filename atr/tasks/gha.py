@@ -38,11 +38,15 @@ import atr.tasks.checks as checks
 from atr.models.results import DistributionWorkflowStatus
 
 _BASE_URL: Final[str] = "https://api.github.com/repos"
-_IN_PROGRESS_STATUSES: Final[list[str]] = ["in_progress", "queued", "requested", "waiting", "pending", "expected"]
-_COMPLETED_STATUSES: Final[list[str]] = ["completed"]
-_FAILED_STATUSES: Final[list[str]] = ["failure", "startup_failure"]
+_IN_PROGRESS_STATUSES: Final = frozenset({"in_progress", "queued", "requested", "waiting", "pending", "expected"})
+_COMPLETED_STATUSES: Final = frozenset({"completed"})
+_FAILED_STATUSES: Final = frozenset({"failure", "startup_failure"})
+_RETRY_INITIAL_DELAY_S: Final[float] = 0.1
+_RETRY_MAX_DELAY_S: Final[float] = 2.0
 _TIMEOUT_S = 60
 
+_global_session: aiohttp.ClientSession | None = None
+
 
 class DistributionWorkflow(schema.Strict):
     """Arguments for the task to start a Github Actions workflow."""
@@ -67,6 +71,14 @@ class WorkflowStatusCheck(schema.Strict):
     asf_uid: str = schema.description("ASF UID of the user triggering the workflow")
 
 
+async def session_close() -> None:
+    """Close the shared GitHub API session, if one is open."""
+    global _global_session
+    if _global_session is not None:
+        await _global_session.close()
+        _global_session = None
+
+
 @checks.with_model(DistributionWorkflow)
 async def trigger_workflow(args: DistributionWorkflow, *, task_id: int | None = None) -> results.Results | None:
     unique_id = f"atr-dist-{args.name}-{uuid.uuid4()}"
@@ -95,31 +107,31 @@ async def trigger_workflow(args: DistributionWorkflow, *, task_id: int | None =
             json.dumps(args.arguments, indent=2)
         }"
     )
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.post(
-                f"{_BASE_URL}/apache/tooling-actions/actions/workflows/{workflow}/dispatches",
-                headers=headers,
-                json=payload,
-            ) as response:
-                response.raise_for_status()
-        except aiohttp.ClientResponseError as e:
-            _fail(f"Failed to trigger GitHub workflow: {e.message} ({e.status})")
+    session = await _session()
+    try:
+        async with session.post(
+            f"{_BASE_URL}/apache/tooling-actions/actions/workflows/{workflow}/dispatches",
+            headers=headers,
+            json=payload,
+        ) as response:
+            response.raise_for_status()
+    except aiohttp.ClientResponseError as e:
+        _fail(f"Failed to trigger GitHub workflow: {e.message} ({e.status})")
 
-        run, run_id = await _find_triggered_run(session, headers, unique_id)
+    run, run_id = await _find_triggered_run(session, headers, unique_id)
 
-        if run.get("status") in _FAILED_STATUSES:
-            _fail(f"Github workflow apache/tooling-actions/{workflow} run {run_id} failed with error")
-        async with storage.write_as_committee_member(args.committee_name, args.asf_uid) as w:
-            try:
-                await w.workflowstatus.add_workflow_status(
-                    workflow, run_id, args.project_name, task_id, status=run.get("status")
-                )
-            except storage.AccessError as e:
-                _fail(f"Failed to record distribution: {e}")
-        return results.DistributionWorkflow(
-            kind="distribution_workflow", name=args.name, run_id=run_id, url=run.get("html_url", "")
-        )
+    if run.get("status") in _FAILED_STATUSES:
+        _fail(f"Github workflow apache/tooling-actions/{workflow} run {run_id} failed with error")
+    async with storage.write_as_committee_member(args.committee_name, args.asf_uid) as w:
+        try:
+            await w.workflowstatus.add_workflow_status(
+                workflow, run_id, args.project_name, task_id, status=run.get("status")
+            )
+        except storage.AccessError as e:
+            _fail(f"Failed to record distribution: {e}")
+    return results.DistributionWorkflow(
+        kind="distribution_workflow", name=args.name, run_id=run_id, url=run.get("html_url", "")
+    )
 
 
 @checks.with_model(WorkflowStatusCheck)
@@ -130,16 +142,16 @@ async def status_check(args: WorkflowStatusCheck) -> DistributionWorkflowStatus:
     log.info("Updating Github workflow statuses from apache/tooling-actions")
     runs = []
     try:
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(
-                    f"{_BASE_URL}/apache/tooling-actions/actions/runs?event=workflow_dispatch", headers=headers
-                ) as response:
-                    response.raise_for_status()
-                    resp_json = await response.json()
-                    runs = resp_json.get("workflow_runs", [])
-            except aiohttp.ClientResponseError as e:
-                _fail(f"Failed to lookup GitHub workflows: {e.message} ({e.status})")
+        session = await _session()
+        try:
+            async with session.get(
+                f"{_BASE_URL}/apache/tooling-actions/actions/runs?event=workflow_dispatch", headers=headers
+            ) as response:
+                response.raise_for_status()
+                resp_json = await response.json()
+                runs = resp_json.get("workflow_runs", [])
+        except aiohttp.ClientResponseError as e:
+            _fail(f"Failed to lookup GitHub workflows: {e.message} ({e.status})")
 
         updated_count = 0
 
@@ -207,13 +219,15 @@ async def _find_triggered_run(
     """Find the workflow run that was just triggered."""
 
     def get_run(resp: dict[str, Any]) -> dict[str, Any] | None:
-        return next(
-            (r for r in resp["workflow_runs"] if (r["head_branch"] == "main") and (r["name"] == unique_id)),
-            None,
-        )
+        # The branch and event are filtered by GitHub, and the name is unique
+        return next((r for r in resp["workflow_runs"] if r["name"] == unique_id), None)
 
     run = await _request_and_retry(
-        session, f"{_BASE_URL}/apache/tooling-actions/actions/runs?event=workflow_dispatch", headers, get_run
+        session,
+        f"{_BASE_URL}/apache/tooling-actions/actions/runs"
+        "?event=workflow_dispatch&branch=main&exclude_pull_requests=true&per_page=30",
+        headers,
+        get_run,
     )
     if run is None:
         _fail(f"Failed to find triggered workflow run for {unique_id}")
@@ -254,24 +268,29 @@ async def _request_and_retry(
     headers: dict[str, str],
     response_func: Callable[[Any], dict[str, Any] | None],
 ) -> dict[str, Any] | None:
-    for _attempt in range(_TIMEOUT_S * 10):  # timeout_s * 10):
-        async with session.get(
-            url,
-            headers=headers,
-        ) as response:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + _TIMEOUT_S
+    etag: str | None = None
+    attempt = 0
+    while True:
+        # GitHub answers 304 without a body when the runs have not changed since the last ETag
+        request_headers = headers if (etag is None) else {**headers, "If-None-Match": etag}
+        async with session.get(url, headers=request_headers) as response:
             try:
                 response.raise_for_status()
-                runs = await response.json()
-                data = response_func(runs)
-                if not data:
-                    await asyncio.sleep(0.1)
-                else:
-                    return data
+                if response.status != 304:
+                    etag = response.headers.get("ETag")
+                    data = response_func(await response.json())
+                    if data:
+                        return data
             except aiohttp.ClientResponseError as e:
                 # We don't raise here as it could be an ephemeral error - if it continues it will return None
-                log.error(f"Failure calling Github: {e.message} ({e.status}, attempt {_attempt + 1})")
-                await asyncio.sleep(0.1)
-    return None
+                log.error(f"Failure calling Github: {e.message} ({e.status}, attempt {attempt + 1})")
+        delay = min(_RETRY_INITIAL_DELAY_S * (2**attempt), _RETRY_MAX_DELAY_S)
+        if (loop.time() + delay) > deadline:
+            return None
+        await asyncio.sleep(delay)
+        attempt += 1
 
 
 async def _schedule_next(args: WorkflowStatusCheck) -> None:
@@ -283,6 +302,15 @@ async def _schedule_next(args: WorkflowStatusCheck) -> None:
         )
 
 
+async def _session() -> aiohttp.ClientSession:
+    """Return the shared GitHub API session, keeping connections to GitHub warm between calls."""
+    global _global_session
+    if (_global_session is None) or _global_session.closed:
+        connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=300, ttl_dns_cache=300)
+        _global_session = aiohttp.ClientSession(connector=connector)
+    return _global_session
+
+
 #
 # async def _wait_for_completion(
 #     session: aiohttp.ClientSession,
@@ -16,11 +16,11 @@
 # under the License.
 
 import asyncio
+import logging
 import pathlib
-from typing import Any
+from typing import Any, Final
 
 import aiofiles.os
-import aioshutil
 
 import atr.log as log
 import atr.models.results as results
@@ -28,6 +28,9 @@ import atr.models.schema as schema
 import atr.storage as storage
 import atr.tasks.checks as checks
 
+_OUTPUT_LIMIT_BYTES: Final[int] = 1024 * 1024
+_READ_CHUNK_BYTES: Final[int] = 64 * 1024
+
 
 class SvnImport(schema.Strict):
     """Arguments for the task to import files from SVN."""
@@ -81,6 +84,7 @@ async def _import_files_core(args: SvnImport) -> str:
             log.debug(f"Created revision directory: {creating.interim_path}")
 
             final_target_path = creating.interim_path
+            final_target_exists = True
             if args.target_subdirectory:
                 final_target_path = creating.interim_path / args.target_subdirectory
                 # Validate that final_target_path is a subdirectory of new_revision_dir
@@ -89,7 +93,8 @@ async def _import_files_core(args: SvnImport) -> str:
                         f"Target subdirectory {args.target_subdirectory}"
                         f" is not a subdirectory of {creating.interim_path}"
                     )
-                await aiofiles.os.makedirs(final_target_path, exist_ok=True)
+                final_target_exists = await aiofiles.os.path.exists(final_target_path)
+                await aiofiles.os.makedirs(final_target_path.parent, exist_ok=True)
 
             temp_export_path = creating.interim_path / temp_export_dir_name
 
@@ -111,35 +116,51 @@ async def _import_files_core(args: SvnImport) -> str:
             # Move files from temp export path to final target path
             # We only have to do this to avoid the SVN pegged revision issue
             log.info(f"Moving exported files from {temp_export_path} to {final_target_path}")
-            for item_name in await aiofiles.os.listdir(temp_export_path):
-                source_item = temp_export_path / item_name
-                destination_item = final_target_path / item_name
-                try:
-                    await aioshutil.move(str(source_item), str(destination_item))
-                except FileExistsError:
-                    log.warning(f"Item {destination_item} already exists, skipping move for {item_name}")
-                except Exception as move_err:
-                    log.error(f"Error moving {source_item} to {destination_item}: {move_err}")
-            await aiofiles.os.rmdir(temp_export_path)
-            log.info(f"Removed temporary export directory: {temp_export_path}")
+            await _import_files_core_move_exported(temp_export_path, final_target_path, final_target_exists)
 
         if creating.new is None:
             raise SvnImportError("Internal error: New revision not found")
         return f"Successfully imported files from SVN into revision {creating.new.number}"
 
 
+async def _import_files_core_move_exported(
+    temp_export_path: pathlib.Path, final_target_path: pathlib.Path, final_target_exists: bool
+) -> None:
+    """Move the exported files into place, renaming the whole export when possible."""
+    if not final_target_exists:
+        # A single rename, as the target subdirectory does not exist yet
+        await aiofiles.os.rename(temp_export_path, final_target_path)
+        return
+
+    for item_name in await aiofiles.os.listdir(temp_export_path):
+        source_item = temp_export_path / item_name
+        destination_item = final_target_path / item_name
+        try:
+            # The whole export is on one filesystem, so a rename never has to copy
+            await aiofiles.os.rename(source_item, destination_item)
+        except OSError as move_err:
+            log.error(f"Error moving {source_item} to {destination_item}: {move_err}")
+    await aiofiles.os.rmdir(temp_export_path)
+    log.info(f"Removed temporary export directory: {temp_export_path}")
+
+
 async def _import_files_core_run_svn_export(svn_command: list[str], temp_export_path: pathlib.Path) -> None:
     """Execute the svn export command and handle errors."""
     log.info(f"Executing SVN command: {' '.join(svn_command)}")
 
     timeout_seconds = 600
     try:
+        # Export prints a line per file, which we only ever log at debug level
+        stdout_target = asyncio.subprocess.PIPE if log.enabled(logging.DEBUG) else asyncio.subprocess.DEVNULL
         process = await asyncio.create_subprocess_exec(
             *svn_command,
-            stdout=asyncio.subprocess.PIPE,
+            stdout=stdout_target,
             stderr=asyncio.subprocess.PIPE,
         )
-        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout_seconds)
+        stdout, stderr, _returncode = await asyncio.wait_for(
+            asyncio.gather(_read_capped(process.stdout), _read_capped(process.stderr), process.wait()),
+            timeout=timeout_seconds,
+        )
 
         stdout_str = stdout.decode("utf-8", errors="ignore").strip() if stdout else ""
         stderr_str = stderr.decode("utf-8", errors="ignore").strip() if stderr else ""
@@ -168,3 +189,15 @@ async def _import_files_core_run_svn_export(svn_command: list[str], temp_export_
     except Exception as e:
         log.exception("Unexpected error during SVN export subprocess execution")
         raise SvnImportError(f"Unexpected error during SVN export: {e}")
+
+
+async def _read_capped(stream: asyncio.StreamReader | None) -> bytes:
+    """Drain a subprocess stream, keeping only the start of its output."""
+    if stream is None:
+        return b""
+    kept = bytearray()
+    while chunk := await stream.read(_READ_CHUNK_BYTES):
+        # Keep reading after the limit so that the process never blocks on a full pipe
+        if len(kept) < _OUTPUT_LIMIT_BYTES:
+            kept += chunk[: _OUTPUT_LIMIT_BYTES - len(kept)]
+    return bytes(kept)
@@ -62,7 +62,7 @@ async def _initiate_core_logic(args: Initiate) -> results.Results | None:
     log.info("Starting initiate_core")
 
     # Validate arguments
-    if not (args.email_to.endswith("@apache.org") or args.email_to.endswith(".apache.org")):
+    if not args.email_to.endswith(("@apache.org", ".apache.org")):
         log.error(f"Invalid destination email address: {args.email_to}")
         raise VoteInitiationError("Invalid destination email address")
 
@@ -74,9 +74,11 @@ async def _initiate_core_logic(args: Initiate) -> results.Results | None:
         if latest_revision_number is None:
             raise VoteInitiationError(f"No revisions found for release {args.release_name}")
 
-        ongoing_tasks = await interaction.tasks_ongoing(release.project.name, release.version, latest_revision_number)
-        if ongoing_tasks > 0:
-            raise VoteInitiationError(f"Cannot start vote for {args.release_name} as {ongoing_tasks} are not complete")
+    # The task count depends on the release, so it cannot overlap with the release query
+    # It uses its own session, so we release ours first rather than hold two connections
+    ongoing_tasks = await interaction.tasks_ongoing(release.project.name, release.version, latest_revision_number)
+    if ongoing_tasks > 0:
+        raise VoteInitiationError(f"Cannot start vote for {args.release_name} as {ongoing_tasks} are not complete")
 
     # Calculate vote end date
     vote_duration_hours = args.vote_duration
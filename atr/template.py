@@ -16,7 +16,13 @@
 # under the License.
 
 import asyncio
-from typing import Any
+import concurrent.futures
+import contextvars
+import functools
+import inspect
+import os
+from collections.abc import Callable, Coroutine
+from typing import Any, Final
 
 import jinja2
 import quart
@@ -26,6 +32,19 @@ import quart.signals as signals
 import atr.htm as htm
 import atr.util as util
 
+# A render thread waits this long for an async template function before the render fails
+_ASYNC_CALL_TIMEOUT_S: Final[float] = 30.0
+# Renders are CPU bound, so there is no use in having more threads than cores
+_RENDER_POOL: Final = concurrent.futures.ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4, thread_name_prefix="template-render"
+)
+# Every template is preloaded, so the cache never needs to evict
+_SYNC_CACHE_SIZE: Final[int] = -1
+
+_global_blank_template: jinja2.Template | None = None
+_global_sync_env: jinja2.Environment | None = None
+_global_sync_templates: dict[str, jinja2.Template] = {}
+
 render_async = quart.render_template
 
 
@@ -36,10 +55,10 @@ async def blank(
     javascripts: list[str] | None = None,
     typescripts: list[str] | None = None,
 ) -> str:
-    js_urls = [util.static_url(f"js/src/{name}.js") for name in javascripts or []]
-    ts_urls = [util.static_url(f"js/ts/{name}.js") for name in typescripts or []]
+    js_urls = [_script_url(f"js/src/{name}.js") for name in javascripts or []]
+    ts_urls = [_script_url(f"js/ts/{name}.js") for name in typescripts or []]
     return await render_sync(
-        "blank.html",
+        _blank_template(sync_environment(quart.current_app)),
         title=title,
         description=description or title,
         content=content,
@@ -53,27 +72,96 @@ async def render_sync(
 ) -> str:
     app_instance = quart.current_app
     await app_instance.update_template_context(context_vars)
-    template = app_instance.jinja_env.get_or_select_template(template_name_or_list)
+    _bridge_async_functions(context_vars, asyncio.get_running_loop())
+    template = _sync_template(sync_environment(app_instance), template_name_or_list)
     return await _render_in_thread(template, context_vars, app_instance)
 
 
 render = render_sync
 
 
+def sync_environment(app_instance: app.Quart) -> jinja2.Environment:
+    """Return a synchronous overlay of the Jinja environment of the app."""
+    global _global_sync_env
+    if _global_sync_env is None:
+        # Quart always enables async mode, which makes each render in a thread run its own event loop
+        # The overlay needs its own cache, because the templates in the parent are compiled for async mode
+        # Only the overlay gets a bytecode cache, because the cache keys do not distinguish async mode
+        _global_sync_env = app_instance.jinja_env.overlay(
+            enable_async=False,
+            cache_size=_SYNC_CACHE_SIZE,
+            bytecode_cache=jinja2.FileSystemBytecodeCache(str(util.get_template_cache_dir())),
+        )
+    return _global_sync_env
+
+
+def _blank_template(environment: jinja2.Environment) -> jinja2.Template:
+    # The blank template is used for most pages, so keep a direct reference to it
+    global _global_blank_template
+    if environment.auto_reload:
+        return environment.get_template("blank.html")
+    if _global_blank_template is None:
+        _global_blank_template = environment.get_template("blank.html")
+    return _global_blank_template
+
+
+def _bridge_async_functions(context: dict[str, Any], loop: asyncio.AbstractEventLoop) -> None:
+    # Only templates which call these, such as the topnav, pay for the queries behind them
+    for name, value in context.items():
+        if inspect.iscoroutinefunction(value):
+            context[name] = functools.partial(_call_on_loop, loop, value)
+
+
+def _call_on_loop(
+    loop: asyncio.AbstractEventLoop, function: Callable[..., Coroutine[Any, Any, Any]], *args: Any, **kwargs: Any
+) -> Any:
+    # The loop is free while it awaits the render, so this only blocks the render thread
+    future = asyncio.run_coroutine_threadsafe(function(*args, **kwargs), loop)
+    try:
+        return future.result(timeout=_ASYNC_CALL_TIMEOUT_S)
+    except TimeoutError:
+        # Do not leave the coroutine running on the loop after the render has given up on it
+        future.cancel()
+        raise
+
+
 async def _render_in_thread(template: jinja2.Template, context: dict, app: app.Quart) -> str:
-    if template.environment.is_async is False:
-        raise RuntimeError("Template environment is not async")
-    await signals.before_render_template.send_async(
-        app,
-        _sync_wrapper=app.ensure_async,  # pyright: ignore[reportArgumentType]
-        template=template,
-        context=context,
-    )
-    rendered_template = await asyncio.to_thread(template.render, context)
-    await signals.template_rendered.send_async(
-        app,
-        _sync_wrapper=app.ensure_async,  # pyright: ignore[reportArgumentType]
-        template=template,
-        context=context,
-    )
+    # Nothing connects to these signals in production, so avoid dispatching when there are no receivers
+    if signals.before_render_template.receivers:
+        await signals.before_render_template.send_async(
+            app,
+            _sync_wrapper=app.ensure_async,  # pyright: ignore[reportArgumentType]
+            template=template,
+            context=context,
+        )
+    # Run in a copy of the context, as asyncio.to_thread does, so that Quart globals such as url_for still work
+    render_call = functools.partial(contextvars.copy_context().run, template.render, context)
+    rendered_template = await asyncio.get_running_loop().run_in_executor(_RENDER_POOL, render_call)
+    if signals.template_rendered.receivers:
+        await signals.template_rendered.send_async(
+            app,
+            _sync_wrapper=app.ensure_async,  # pyright: ignore[reportArgumentType]
+            template=template,
+            context=context,
+        )
     return rendered_template
+
+
+@functools.lru_cache(maxsize=256)
+def _script_url(filename: str) -> str:
+    # Static URLs do not change while the app is running, so avoid building them for every page
+    return util.static_url(filename)
+
+
+def _sync_template(
+    environment: jinja2.Environment,
+    template_name_or_list: str | jinja2.Template | list[str | jinja2.Template],
+) -> jinja2.Template:
+    # Skip the locked LRU lookup in Jinja, unless templates may be reloaded from disk
+    if (not isinstance(template_name_or_list, str)) or environment.auto_reload:
+        return environment.get_or_select_template(template_name_or_list)
+    template = _global_sync_templates.get(template_name_or_list)
+    if template is None:
+        template = environment.get_template(template_name_or_list)
+        _global_sync_templates[template_name_or_list] = template
+    return template
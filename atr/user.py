@@ -30,21 +30,18 @@ async def candidate_drafts(uid: str, user_projects: list[sql.Project] | None = N
 
     if user_projects is None:
         user_projects = await projects(uid)
-    user_candidate_drafts: list[sql.Release] = []
-    for p in user_projects:
-        releases = await interaction.candidate_drafts(p)
-        user_candidate_drafts.extend(releases)
-    return user_candidate_drafts
+    return await interaction.releases_by_phase_for_projects(user_projects, sql.ReleasePhase.RELEASE_CANDIDATE_DRAFT)
 
 
 @functools.cache
-def get_admin_users() -> set[str]:
-    admin_users = set(config.get().ADMIN_USERS)
-    if config.get().ALLOW_TESTS:
+def get_admin_users() -> frozenset[str]:
+    # The result is cached and shared, so it must not be mutable
+    app_config = config.get()
+    if app_config.ALLOW_TESTS:
         # TODO: Just for debugging, but ideally we would do this in a targeted way
         # We need this, for example, for deleting releases
-        admin_users.add("test")
-    return admin_users
+        return app_config.ADMIN_USERS | {"test"}
+    return app_config.ADMIN_USERS
 
 
 def is_admin(user_id: str | None) -> bool:
@@ -57,36 +54,38 @@ def is_admin(user_id: str | None) -> bool:
 def is_committee_member(committee: sql.Committee | None, uid: str) -> bool:
     if committee is None:
         return False
-    return any((member_uid == uid) for member_uid in committee.committee_members)
+    return uid in committee.committee_members
 
 
 def is_committer(committee: sql.Committee | None, uid: str) -> bool:
     if committee is None:
         return False
-    return any((committer_uid == uid) for committer_uid in committee.committers)
+    return uid in committee.committers
 
 
 async def projects(uid: str, committee_only: bool = False, super_project: bool = False) -> list[sql.Project]:
-    user_projects: list[sql.Project] = []
     async with db.session() as data:
         # Must have releases, because this is used in candidate_drafts
-        projects = await data.project(
-            status=sql.ProjectStatus.ACTIVE, _committee=True, _releases=True, _super_project=super_project
+        # Membership is tested in the database, so that only the projects of the user are loaded
+        user_projects = await data.project(
+            status=sql.ProjectStatus.ACTIVE,
+            committee_member=uid if committee_only else db.NOT_SET,
+            committee_participant=db.NOT_SET if committee_only else uid,
+            _committee=True,
+            _releases=True,
+            _super_project=super_project,
         ).all()
-        for p in projects:
-            if p.committee is None:
-                continue
-
-            # Allow access to test project when ALLOW_TESTS is enabled
-            # This means that the Test project will show in the user interface for everyone
-            if config.get().ALLOW_TESTS and (p.committee.name == "test"):
-                user_projects.append(p)
-                continue
-
-            if committee_only:
-                if uid in p.committee.committee_members:
-                    user_projects.append(p)
-            else:
-                if (uid in p.committee.committee_members) or (uid in p.committee.committers):
-                    user_projects.append(p)
-    return user_projects
+
+        # Allow access to test project when ALLOW_TESTS is enabled
+        # This means that the Test project will show in the user interface for everyone
+        if config.get().ALLOW_TESTS:
+            test_projects = await data.project(
+                status=sql.ProjectStatus.ACTIVE,
+                committee_name="test",
+                _committee=True,
+                _releases=True,
+                _super_project=super_project,
+            ).all()
+            user_project_names = {p.name for p in user_projects}
+            user_projects = [*user_projects, *(p for p in test_projects if p.name not in user_project_names)]
+    return list(user_projects)
@@ -21,6 +21,7 @@ import binascii
 import contextlib
 import dataclasses
 import datetime
+import functools
 import hashlib
 import json
 import os
@@ -202,10 +203,15 @@ async def atomic_write_file(file_path: pathlib.Path, content: str, encoding: str
 def chmod_directories(path: pathlib.Path, permissions: int = 0o755) -> None:
     # codeql[py/overly-permissive-file]
     os.chmod(path, permissions)
-    for dir_path in path.rglob("*"):
-        if dir_path.is_dir():
-            # codeql[py/overly-permissive-file]
-            os.chmod(dir_path, permissions)
+    # Directory entries carry their type, so unlike rglob this needs no stat call per file
+    pending = [str(path)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # codeql[py/overly-permissive-file]
+                    os.chmod(entry.path, permissions)
+                    pending.append(entry.path)
 
 
 def committee_is_standing(committee_name: str) -> bool:
@@ -485,6 +491,10 @@ async def get_release_stats(release: sql.Release) -> tuple[int, int, str]:
     return count, total_bytes, formatted_size
 
 
+def get_template_cache_dir() -> pathlib.Path:
+    return pathlib.Path(config.get().STATE_DIR) / "cache" / "templates"
+
+
 def get_tmp_dir() -> pathlib.Path:
     # This must be on the same filesystem as the other state subdirectories
     return pathlib.Path(config.get().STATE_DIR) / "tmp"
@@ -536,6 +546,8 @@ async def has_files(release: sql.Release) -> bool:
     return False
 
 
+# APP_HOST is read from the environment once, so this never changes within a process
+@functools.cache
 def is_dev_environment() -> bool:
     conf = config.get()
     for development_host in ("127.0.0.1", "atr", "atr-dev", "localhost.apache.org"):
@@ -581,6 +593,7 @@ def key_ssh_fingerprint(ssh_key_string: str) -> str:
         raise SshFingerprintError(str(e)) from e
 
 
+@functools.lru_cache(maxsize=4096)
 def key_ssh_fingerprint_core(ssh_key_string: str) -> str:
     # The format should be as in *.pub or authorized_keys files
     # I.e. TYPE DATA COMMENT
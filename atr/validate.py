@@ -16,10 +16,14 @@
 # under the License.
 
 import asyncio
+import collections
+import contextvars
 import datetime
+import os
 import pathlib
+import re
 from collections.abc import AsyncGenerator, Callable, Generator, Iterable, Sequence
-from typing import NamedTuple, TypeVar
+from typing import Final, NamedTuple, TypeVar
 
 import atr.db as db
 import atr.models.sql as sql
@@ -50,6 +54,16 @@ type ReleaseAnnotatedDivergences = Callable[[sql.Release], AnnotatedDivergences]
 
 T = TypeVar("T")
 
+_BATCH_SIZE: Final[int] = 50
+
+# Labels are separated by commas, may be padded with whitespace, and must not be empty or contain colons
+_LABELS: Final = re.compile(r"\s*[^,:\s][^,:]*(?:,\s*[^,:\s][^,:]*)*")
+
+_nonempty_dirs_ctx: contextvars.ContextVar[frozenset[pathlib.Path] | None] = contextvars.ContextVar(
+    "nonempty_dirs", default=None
+)
+_now_ctx: contextvars.ContextVar[datetime.datetime | None] = contextvars.ContextVar("now", default=None)
+
 
 def committee(c: sql.Committee) -> AnnotatedDivergences:
     """Check that a committee is valid."""
@@ -126,43 +140,55 @@ def committees(cs: Iterable[sql.Committee]) -> AnnotatedDivergences:
         yield from committee(c)
 
 
-def divergences[T](expected: T, actual: T) -> Divergences:
-    """Compare two values and yield the divergence if they differ."""
+def divergences[T](expected: T, actual: T) -> tuple[Divergence, ...]:
+    """Compare two values and return the divergence if they differ."""
     if expected != actual:
-        yield Divergence(repr(expected), repr(actual))
+        return (Divergence(repr(expected), repr(actual)),)
+    return ()
 
 
-def divergences_predicate[T](okay: Callable[[T], bool], expected: str, actual: T) -> Divergences:
-    """Apply a predicate to a value and yield the divergence if false."""
+def divergences_predicate[T](okay: Callable[[T], bool], expected: str, actual: T) -> tuple[Divergence, ...]:
+    """Apply a predicate to a value and return the divergence if false."""
     if not okay(actual):
-        yield Divergence(expected, repr(actual))
+        return (Divergence(expected, repr(actual)),)
+    return ()
 
 
 def divergences_with_annotations(
     components: Sequence[str],
     validator: str,
     source: str,
-    ds: Divergences,
-) -> AnnotatedDivergences:
+    ds: Iterable[Divergence],
+) -> tuple[AnnotatedDivergence, ...]:
     """Wrap divergences with components, validator, and source."""
-    for d in ds:
-        yield AnnotatedDivergence(list(components), validator, source, d)
+    return tuple(AnnotatedDivergence(list(components), validator, source, d) for d in ds)
 
 
 async def everything(data: db.Session) -> AsyncAnnotatedDivergences:
     """Yield divergences for all projects and releases in the DB."""
-    committees_sorted = await data.committee(_child_committees=True).order_by(sql.Committee.name).all()
-    projects_sorted = await data.project(_distribution_channels=True).order_by(sql.Project.name).all()
-    releases_sorted = await data.release().order_by(sql.Release.name).all()
+    # Validators run in this context, so that values computed once per run reach them in the worker threads
+    context = contextvars.copy_context()
+    context.run(_now_ctx.set, datetime.datetime.now(datetime.UTC))
+
+    # A session cannot run queries concurrently, so the projects and releases each need their own
+    # The releases load their projects eagerly, because the validators need them after the session closes
+    async with db.session() as projects_data, db.session() as releases_data:
+        committees_sorted, projects_sorted, releases_sorted = await asyncio.gather(
+            data.committee(_child_committees=True).order_by(sql.Committee.name).all(),
+            projects_data.project(_distribution_channels=True).order_by(sql.Project.name).all(),
+            releases_data.release(_project=True).order_by(sql.Release.name).all(),
+        )
 
-    for c in await asyncio.to_thread(committees, committees_sorted):
-        yield c
+    async for d in _batched(committees, committees_sorted, context):
+        yield d
 
-    for p in await asyncio.to_thread(projects, projects_sorted):
-        yield p
+    async for d in _batched(projects, projects_sorted, context):
+        yield d
 
-    for r in await asyncio.to_thread(releases, releases_sorted):
-        yield r
+    nonempty_dirs = await asyncio.to_thread(_nonempty_release_directories, releases_sorted)
+    context.run(_nonempty_dirs_ctx.set, nonempty_dirs)
+    async for d in _batched(releases, releases_sorted, context):
+        yield d
 
 
 def project(p: sql.Project) -> AnnotatedDivergences:
@@ -198,17 +224,8 @@ def project_components(
 @project_components("Project.category")
 def project_category(p: sql.Project) -> Divergences:
     """Check that the category string uses 'label, label' syntax without colons."""
-
-    def okay(cat: str | None) -> bool:
-        if not cat:
-            return True
-        tokens = [t.strip() for t in cat.split(",")]
-        if any((not t) or (":" in t) for t in tokens):
-            return False
-        return True
-
     expected = "comma separated labels without colon"
-    yield from divergences_predicate(okay, expected, p.category)
+    yield from divergences_predicate(_labels_ok, expected, p.category)
 
 
 @project_components("Project.committee_name")
@@ -225,7 +242,7 @@ def project_committee(p: sql.Project) -> Divergences:
 @project_components("Project.created")
 def project_created(p: sql.Project) -> Divergences:
     """Check that the project created timestamp is in the past."""
-    now = datetime.datetime.now(datetime.UTC)
+    now = _now()
 
     def predicate(dt: datetime.datetime) -> bool:
         return dt < now
@@ -248,17 +265,8 @@ def project_full_name(p: sql.Project) -> Divergences:
 @project_components("Project.programming_languages")
 def project_programming_languages(p: sql.Project) -> Divergences:
     """Check that programming_languages uses 'label, label' syntax without colons."""
-
-    def okay(pl: str | None) -> bool:
-        if not pl:
-            return True
-        tokens = [t.strip() for t in pl.split(",")]
-        if any((not t) or (":" in t) for t in tokens):
-            return False
-        return True
-
     expected = "comma separated labels without colon"
-    yield from divergences_predicate(okay, expected, p.programming_languages)
+    yield from divergences_predicate(_labels_ok, expected, p.programming_languages)
 
 
 @project_components("Project.release_policy")
@@ -276,16 +284,40 @@ def projects(ps: Iterable[sql.Project]) -> AnnotatedDivergences:
         yield from project(p)
 
 
-def release(r: sql.Release) -> AnnotatedDivergences:
+def release(r: sql.Release) -> list[AnnotatedDivergence]:
     """Check that a release is valid."""
-    yield from release_created(r)
-    yield from release_name(r)
-    yield from release_on_disk(r)
-    yield from release_package_managers(r)
-    yield from release_released(r)
-    yield from release_sboms(r)
-    yield from release_vote_logic(r)
-    yield from release_votes(r)
+    # Equivalent to each release validator in turn, but reads each field once without the decorator layers
+    now = _now()
+    path = util.release_directory(r)
+    expected_name = sql.release_name(r.project_name, r.version)
+    vote_dates = (r.vote_started, r.vote_resolved)
+    checks = (
+        (("Release.created",), "release_created", r.created < now, "value to be in the past", r.created),
+        (("Release.name",), "release_name", expected_name == r.name, repr(expected_name), r.name),
+        (("Release",), "release_on_disk", _on_disk(path), "directory to exist and contain files", path),
+        (("Release.package_managers",), "release_package_managers", r.package_managers == [], "[]", r.package_managers),
+        (
+            ("Release.released",),
+            "release_released",
+            (r.released is None) or (r.released < now),
+            "value to be in the past or None",
+            r.released,
+        ),
+        (("Release.sboms",), "release_sboms", r.sboms == [], "[]", r.sboms),
+        (
+            ("Release.vote_started", "Release.vote_resolved"),
+            "release_vote_logic",
+            _vote_logic_okay(vote_dates),
+            "vote_started to be set when vote_resolved is set",
+            vote_dates,
+        ),
+        (("Release.votes",), "release_votes", r.votes == [], "[]", r.votes),
+    )
+    return [
+        AnnotatedDivergence(list(components), validator, r.name, Divergence(expected, repr(actual)))
+        for components, validator, okay, expected, actual in checks
+        if not okay
+    ]
 
 
 def release_components(
@@ -310,7 +342,7 @@ def release_components(
 @release_components("Release.created")
 def release_created(r: sql.Release) -> Divergences:
     """Check that the release created date is in the past."""
-    now = datetime.datetime.now(datetime.UTC)
+    now = _now()
 
     def predicate(dt: datetime.datetime) -> bool:
         return dt < now
@@ -331,13 +363,8 @@ def release_name(r: sql.Release) -> Divergences:
 def release_on_disk(r: sql.Release) -> Divergences:
     """Check that the release is on disk."""
     path = util.release_directory(r)
-
-    def okay(p: pathlib.Path) -> bool:
-        # The release directory must exist and contain at least one entry
-        return p.exists() and any(p.iterdir())
-
     expected = "directory to exist and contain files"
-    yield from divergences_predicate(okay, expected, path)
+    yield from divergences_predicate(_on_disk, expected, path)
 
 
 @release_components("Release.package_managers")
@@ -351,7 +378,7 @@ def release_package_managers(r: sql.Release) -> Divergences:
 @release_components("Release.released")
 def release_released(r: sql.Release) -> Divergences:
     """Check that the release released date is in the past or None."""
-    now = datetime.datetime.now(datetime.UTC)
+    now = _now()
 
     def okay(dt: datetime.datetime | None) -> bool:
         if dt is None:
@@ -373,19 +400,9 @@ def release_sboms(r: sql.Release) -> Divergences:
 @release_components("Release.vote_started", "Release.vote_resolved")
 def release_vote_logic(r: sql.Release) -> Divergences:
     """Check that the release vote logic is valid."""
-
-    def okay(sr: tuple[datetime.datetime | None, datetime.datetime | None]) -> bool:
-        # The vote_resolved property must not be set unless vote_started is set
-        match sr:
-            case (None, None) | (_, None) | (_, _):
-                return True
-            # case (None, _):
-            #     return False
-        return False
-
     expected = "vote_started to be set when vote_resolved is set"
     actual = (r.vote_started, r.vote_resolved)
-    yield from divergences_predicate(okay, expected, actual)
+    yield from divergences_predicate(_vote_logic_okay, expected, actual)
 
 
 @release_components("Release.votes")
@@ -400,3 +417,59 @@ def releases(rs: Iterable[sql.Release]) -> AnnotatedDivergences:
     """Check that the releases are valid."""
     for r in rs:
         yield from release(r)
+
+
+async def _batched[T](
+    validator: Callable[[Sequence[T]], AnnotatedDivergences], items: Sequence[T], context: contextvars.Context
+) -> AsyncAnnotatedDivergences:
+    # The generator must be drained in the thread, otherwise the validation still runs on the event loop
+    for start in range(0, len(items), _BATCH_SIZE):
+        batch = items[start : start + _BATCH_SIZE]
+        for d in await asyncio.to_thread(context.run, list, validator(batch)):
+            yield d
+
+
+def _labels_ok(labels: str | None) -> bool:
+    return (not labels) or (_LABELS.fullmatch(labels) is not None)
+
+
+def _nonempty_children(parent: pathlib.Path, names: set[str]) -> Generator[pathlib.Path]:
+    try:
+        with os.scandir(parent) as entries:
+            children = [parent / entry.name for entry in entries if (entry.name in names) and entry.is_dir()]
+    except FileNotFoundError:
+        return
+    for child in children:
+        with os.scandir(child) as entries:
+            if next(entries, None) is not None:
+                yield child
+
+
+def _nonempty_release_directories(rs: Iterable[sql.Release]) -> frozenset[pathlib.Path]:
+    # Scan each parent directory once rather than checking every release directory separately
+    names_by_parent: dict[pathlib.Path, set[str]] = collections.defaultdict(set)
+    for r in rs:
+        path = util.release_directory(r)
+        names_by_parent[path.parent].add(path.name)
+    return frozenset(child for parent, names in names_by_parent.items() for child in _nonempty_children(parent, names))
+
+
+def _now() -> datetime.datetime:
+    # Use the time at the start of the run when called from everything
+    if (now := _now_ctx.get()) is not None:
+        return now
+    return datetime.datetime.now(datetime.UTC)
+
+
+def _on_disk(path: pathlib.Path) -> bool:
+    # The release directory must exist and contain at least one entry
+    nonempty_dirs = _nonempty_dirs_ctx.get()
+    if nonempty_dirs is not None:
+        return path in nonempty_dirs
+    return path.exists() and any(path.iterdir())
+
+
+def _vote_logic_okay(sr: tuple[datetime.datetime | None, datetime.datetime | None]) -> bool:
+    # The vote_resolved property must not be set unless vote_started is set
+    vote_started, vote_resolved = sr
+    return (vote_resolved is None) or (vote_started is not None)
@@ -17,7 +17,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import types
 import urllib.parse
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar
 
@@ -26,7 +28,7 @@ import asfquart.session as session
 import markupsafe
 import pydantic_core
 import quart
-import werkzeug.datastructures.headers
+import werkzeug.http
 
 import atr.config as config
 import atr.db as db
@@ -37,7 +39,7 @@ import atr.user as user
 import atr.util as util
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Sequence
+    from collections.abc import Awaitable, Mapping, Sequence
 
     import pydantic
     import werkzeug.wrappers.response as response
@@ -62,9 +64,12 @@ class Committer:
     """Session with extra information about committers."""
 
     def __init__(self, web_session: session.ClientSession) -> None:
+        self.__committee_names: frozenset[str] | None = None
         self.__form_cls: type[form.Form] | None = None
         self.__form_data: dict[str, Any] | None = None
-        self.__projects: list[sql.Project] | None = None
+        self.__host: str | None = None
+        self.__project_names: frozenset[str] | None = None
+        self.__projects: asyncio.Task[list[sql.Project]] | None = None
         self.session = web_session
 
     @property
@@ -83,7 +88,9 @@ class Committer:
         return config.get().APP_HOST
 
     async def check_access(self, project_name: str) -> None:
-        if not any((p.name == project_name) for p in (await self.user_projects)):
+        if self.__project_names is None:
+            self.__project_names = frozenset(p.name for p in (await self.__user_projects_cached()))
+        if project_name not in self.__project_names:
             if user.is_admin(self.uid):
                 # Admins can view all projects
                 # But we must warn them when the project is not one of their own
@@ -94,7 +101,9 @@ class Committer:
             raise base.ASFQuartException("You do not have access to this project", errorcode=403)
 
     async def check_access_committee(self, committee_name: str) -> None:
-        if committee_name not in self.committees:
+        if self.__committee_names is None:
+            self.__committee_names = frozenset(self.committees)
+        if committee_name not in self.__committee_names:
             if user.is_admin(self.uid):
                 # Admins can view all committees
                 # But we must warn them when the committee is not one of their own
@@ -104,10 +113,11 @@ class Committer:
             raise base.ASFQuartException("You do not have access to this committee", errorcode=403)
 
     async def form_data(self) -> dict[str, Any]:
-        if self.__form_data is None:
-            self.__form_data = await form.quart_request()
         # Avoid mutations from writing back to our copy
-        return self.__form_data.copy()
+        return (await self.__ensure_form_data()).copy()
+
+    async def form_data_readonly(self) -> Mapping[str, Any]:
+        return types.MappingProxyType(await self.__ensure_form_data())
 
     async def form_error(self, field_name: str, error_msg: str) -> WerkzeugResponse:
         if self.__form_cls is None:
@@ -131,19 +141,14 @@ class Committer:
 
     async def form_validate(self, form_cls: type[form.Form], context: dict[str, Any]) -> pydantic.BaseModel:
         self.__form_cls = form_cls
-        if self.__form_data is None:
-            self.__form_data = await form.quart_request()
-        return form.validate(form_cls, self.__form_data.copy(), context=context)
+        return form.validate(form_cls, (await self.__ensure_form_data()).copy(), context=context)
 
     @property
     def host(self) -> str:
-        request_host = quart.request.host
-        if ":" in request_host:
-            domain, port = request_host.split(":")
-            # Could be an IPv6 address, so need to check whether port is a valid integer
-            if port.isdigit():
-                return domain
-        return request_host
+        # Each request constructs its own Committer, so the host cannot change
+        if self.__host is None:
+            self.__host = _host_without_port(quart.request.host)
+        return self.__host
 
     def only_user_releases(self, releases: Sequence[sql.Release]) -> list[sql.Release]:
         return util.user_releases(self.uid, releases)
@@ -203,7 +208,7 @@ class Committer:
 
     @property
     async def user_candidate_drafts(self) -> list[sql.Release]:
-        return await user.candidate_drafts(self.uid, user_projects=self.__projects)
+        return await user.candidate_drafts(self.uid, user_projects=await self.__user_projects_cached())
 
     # @property
     # async def user_committees(self) -> list[models.Committee]:
@@ -211,9 +216,19 @@ class Committer:
 
     @property
     async def user_projects(self) -> list[sql.Project]:
+        return (await self.__user_projects_cached())[:]
+
+    async def __ensure_form_data(self) -> dict[str, Any]:
+        # Parse the request body at most once, however many form methods are called
+        if self.__form_data is None:
+            self.__form_data = await form.quart_request()
+        return self.__form_data
+
+    async def __user_projects_cached(self) -> list[sql.Project]:
+        # Concurrent callers share the same query instead of each starting their own
         if self.__projects is None:
-            self.__projects = await user.projects(self.uid)
-        return self.__projects[:]
+            self.__projects = asyncio.create_task(user.projects(self.uid))
+        return await self.__projects
 
 
 class ElementResponse(quart.Response):
@@ -237,11 +252,14 @@ class HeaderValue:
             if "\x00" in text:
                 raise ValueError(f"Header value cannot contain null bytes: {text}")
 
-        headers = werkzeug.datastructures.headers.Headers()
-        headers.add("X-Header-Value", value, **kwargs)
-        werkzeug_value = headers.get("X-Header-Value")
-        if werkzeug_value is None:
-            raise ValueError("Header value should not be None after validation")
+        # This is the encoding that Headers.add applies, without constructing a Headers instance
+        werkzeug_value = value
+        if kwargs:
+            werkzeug_value = werkzeug.http.dump_options_header(
+                value, {key.replace("_", "-"): param for key, param in kwargs.items()}
+            )
+        if ("\r" in werkzeug_value) or ("\n" in werkzeug_value):
+            raise ValueError(f"Header value cannot contain newline characters: {werkzeug_value}")
 
         self.__value = werkzeug_value
 
@@ -330,3 +348,12 @@ def valid_url(
     if (not allow_fragment) and parsed.fragment:
         return False
     return True
+
+
+def _host_without_port(request_host: str) -> str:
+    if ":" in request_host:
+        domain, port = request_host.split(":")
+        # Could be an IPv6 address, so need to check whether port is a valid integer
+        if port.isdigit():
+            return domain
+    return request_host
@@ -39,6 +39,7 @@ import atr.models.results as results
 import atr.models.sql as sql
 import atr.tasks as tasks
 import atr.tasks.checks as checks
+import atr.tasks.gha as gha
 import atr.tasks.task as task
 
 # Resource limits, 5 minutes and 1GB
@@ -82,7 +83,10 @@ def main() -> None:
     async def _start() -> None:
         await asyncio.create_task(db.init_database_for_worker())
         tasks.append(asyncio.create_task(_worker_loop_run()))
-        await asyncio.gather(*tasks)
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            await gha.session_close()
 
     asyncio.run(_start())
 
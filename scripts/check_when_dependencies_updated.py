@@ -55,10 +55,12 @@ def main() -> None:
 
 
 def _parse_exclude_newer(lock_path: pathlib.Path) -> str | None:
-    for line in lock_path.read_text(encoding="utf-8").splitlines():
-        if line.startswith("exclude-newer"):
-            _, _, value = line.partition("=")
-            return value.strip().strip('"')
+    # The setting is in the header of the lock file, so stop reading as soon as it is found
+    with lock_path.open(encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("exclude-newer"):
+                _, _, value = line.partition("=")
+                return value.strip().strip('"')
     return None
 
 
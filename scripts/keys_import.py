@@ -20,6 +20,7 @@
 
 import asyncio
 import contextlib
+import functools
 import os
 import pathlib
 import sys
@@ -52,6 +53,7 @@ def find_project_root() -> pathlib.Path:
 PROJECT_ROOT = find_project_root()
 
 
+@functools.lru_cache(maxsize=1024)
 def is_atr_path(path: str) -> bool:
     try:
         resolved = pathlib.Path(path).resolve()
@@ -72,22 +74,19 @@ def print_and_flush(message: str) -> None:
 
 
 def format_exception_location(exc: BaseException) -> str:
+    # Walk the traceback once, keeping the innermost ATR frame and the innermost frame overall
     tb = exc.__traceback__
-    frames: list[TracebackType] = []
+    chosen_tb: TracebackType | None = None
+    last_tb: TracebackType | None = None
     while tb is not None:
-        frames.append(tb)
+        last_tb = tb
+        if is_atr_path(tb.tb_frame.f_code.co_filename):
+            chosen_tb = tb
         tb = tb.tb_next
-    if not frames:
+    if last_tb is None:
         return f"{type(exc).__name__}: {exc}"
-
-    chosen_tb = None
-    for frame_tb in reversed(frames):
-        filename = frame_tb.tb_frame.f_code.co_filename
-        if is_atr_path(filename):
-            chosen_tb = frame_tb
-            break
     if chosen_tb is None:
-        chosen_tb = frames[-1]
+        chosen_tb = last_tb
 
     frame = chosen_tb.tb_frame
     filename_path = pathlib.Path(frame.f_code.co_filename).resolve()
@@ -144,7 +143,7 @@ async def keys_import(conf: config.AppConfig, asf_uid: str) -> None:
     sys.stdout.flush()
 
     # Get all email addresses in LDAP
-    # We'll discard them when we're finished
+    # We'll use them for every committee, and discard them when we're finished
     start = time.perf_counter_ns()
     email_to_uid = await util.email_to_uid_map()
     end = time.perf_counter_ns()
@@ -154,34 +153,28 @@ async def keys_import(conf: config.AppConfig, asf_uid: str) -> None:
     # Get the KEYS file of each committee
     async with db.session() as data:
         committees = await data.committee().all()
-    committees = list(committees)
-    committees.sort(key=lambda c: c.name.lower())
-
-    urls = []
-    for committee in committees:
-        if committee.is_podling:
-            url = f"https://downloads.apache.org/incubator/{committee.name}/KEYS"
-        else:
-            url = f"https://downloads.apache.org/{committee.name}/KEYS"
-        urls.append(url)
+    committees = sorted(committees, key=lambda c: c.name.lower())
+    committee_names_by_url = {
+        f"https://downloads.apache.org/{'incubator/' if c.is_podling else ''}{c.name}/KEYS": c.name for c in committees
+    }
 
     total_yes = 0
     total_no = 0
-    async for url, status, content in util.get_urls_as_completed(urls):
+    async for url, status, content in util.get_urls_as_completed(list(committee_names_by_url)):
         # For each remote KEYS file, check that it responded 200 OK
-        # Extract committee name from URL
-        # This works for both /committee/KEYS and /incubator/committee/KEYS
-        committee_name = url.rsplit("/", 2)[-2]
+        # The URL can differ from the one requested after a redirect, or be empty after a connection error
+        committee_name = committee_names_by_url.get(url) or (url.rsplit("/", 2)[-2] if url else "unknown")
         if status != 200:
             print_and_flush(f"{committee_name} error: {status}")
             continue
 
         # Parse the KEYS file and add it to the database
         # We use a separate storage.write() context for each committee to avoid transaction conflicts
+        # The writer reads the committee again inside its immediate transaction, so we pass only the name
         async with storage.write(asf_uid) as write:
             wafa = write.as_foundation_admin(committee_name)
             keys_file_text = content.decode("utf-8", errors="replace")
-            outcomes = await wafa.keys.ensure_associated(keys_file_text)
+            outcomes = await wafa.keys.ensure_associated(keys_file_text, email_to_uid=email_to_uid)
             log_outcome_errors(outcomes, committee_name)
             yes = outcomes.result_count
             no = outcomes.error_count
@@ -41,8 +41,8 @@ ANNOUNCE_URL: Final[str] = f"/announce/{PROJECT_NAME}/{VERSION_NAME}"
 def announce_context(browser: Browser) -> Generator[BrowserContext]:
     """Create a release in the finish phase."""
 
-    context = browser.new_context(
-        ignore_https_errors=True,
+    context = helpers.new_context(
+        browser,
         # Needed for the copy variable buttons
         permissions=["clipboard-read", "clipboard-write"],
     )
@@ -89,9 +89,9 @@ def announce_context(browser: Browser) -> Generator[BrowserContext]:
     context.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def page_announce(announce_context: BrowserContext) -> Generator[Page]:
-    """Navigate to the announce page with a fresh page for each test."""
+    """Navigate to the announce page once, sharing it between the tests in a module."""
     page = announce_context.new_page()
     helpers.visit(page, ANNOUNCE_URL)
     yield page
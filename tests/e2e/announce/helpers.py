@@ -19,7 +19,7 @@ from playwright.sync_api import Locator, Page
 
 
 def fill_path_suffix(page: Page, value: str) -> Locator:
-    """Fill the download path suffix input and return the help text locator."""
+    """Replace the download path suffix input value and return the help text locator."""
     help_text = page.locator("#download_path_suffix + .form-text")
     page.locator("#download_path_suffix").fill(value)
     return help_text
@@ -15,53 +15,36 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import re
+from typing import Final
+
 import e2e.announce.helpers as helpers  # type: ignore[reportMissingImports]
+import pytest
 from playwright.sync_api import Page, expect
 
-
-def test_path_adds_leading_slash(page_announce: Page) -> None:
-    """Paths without a leading '/' should have one added."""
-    help_text = helpers.fill_path_suffix(page_announce, "apple/banana")
-    expect(help_text).to_contain_text("/apple/banana/")
-
-
-def test_path_adds_trailing_slash(page_announce: Page) -> None:
-    """Paths without a trailing '/' should have one added."""
-    help_text = helpers.fill_path_suffix(page_announce, "/apple/banana")
-    expect(help_text).to_contain_text("/apple/banana/")
-
-
-def test_path_normalises_dot_slash_prefix(page_announce: Page) -> None:
-    """Paths starting with './' should have it converted to '/'."""
-    help_text = helpers.fill_path_suffix(page_announce, "./apple")
-    expect(help_text).to_contain_text("/apple/")
-    expect(help_text).not_to_contain_text("./")
-
-
-def test_path_normalises_single_dot(page_announce: Page) -> None:
-    """A path of '.' should be normalised to '/'."""
-    import re
-
-    help_text = helpers.fill_path_suffix(page_announce, ".")
-    expect(help_text).to_have_text(re.compile(r"/$"))
-
-
-def test_path_rejects_double_dots(page_announce: Page) -> None:
-    """Paths containing '..' should show an error message."""
-    help_text = helpers.fill_path_suffix(page_announce, "../etc/passwd")
-    expect(help_text).to_contain_text("must not contain .. or //")
-
-
-def test_path_rejects_double_slashes(page_announce: Page) -> None:
-    """Paths containing '//' should show an error message."""
-    help_text = helpers.fill_path_suffix(page_announce, "apple//banana")
-    expect(help_text).to_contain_text("must not contain .. or //")
-
-
-def test_path_rejects_hidden_directory(page_announce: Page) -> None:
-    """Paths containing '/.' should show an error message."""
-    help_text = helpers.fill_path_suffix(page_announce, "/apple/.hidden/banana")
-    expect(help_text).to_contain_text("must not contain /.")
+_TRAILING_SLASH: Final = re.compile(r"/$")
+
+
+@pytest.mark.parametrize(
+    ("input_path", "expected", "unexpected"),
+    [
+        pytest.param("apple/banana", "/apple/banana/", None, id="adds_leading_slash"),
+        pytest.param("/apple/banana", "/apple/banana/", None, id="adds_trailing_slash"),
+        pytest.param("./apple", "/apple/", "./", id="normalises_dot_slash_prefix"),
+        pytest.param(".", _TRAILING_SLASH, None, id="normalises_single_dot"),
+        pytest.param("../etc/passwd", "must not contain .. or //", None, id="rejects_double_dots"),
+        pytest.param("apple//banana", "must not contain .. or //", None, id="rejects_double_slashes"),
+        pytest.param("/apple/.hidden/banana", "must not contain /.", None, id="rejects_hidden_directory"),
+    ],
+)
+def test_path_suffix(
+    page_announce: Page, input_path: str, expected: str | re.Pattern[str], unexpected: str | None
+) -> None:
+    """The download path suffix should be normalised, or rejected with an error message."""
+    help_text = helpers.fill_path_suffix(page_announce, input_path)
+    expect(help_text).to_contain_text(expected)
+    if unexpected is not None:
+        expect(help_text).not_to_contain_text(unexpected)
 
 
 def test_submit_button_disabled_until_confirm_typed(page_announce: Page) -> None:
@@ -33,7 +33,7 @@ COMMITTEES_URL: Final[str] = "/committees"
 @pytest.fixture(scope="module")
 def committees_context(browser: Browser) -> Generator[BrowserContext]:
     """Create a browser context with an authenticated user."""
-    context = browser.new_context(ignore_https_errors=True)
+    context = helpers.new_context(browser)
     page = context.new_page()
     helpers.log_in(page)
     page.close()
@@ -38,7 +38,7 @@ COMPOSE_URL: Final[str] = f"/compose/{PROJECT_NAME}/{VERSION_NAME}"
 @pytest.fixture(scope="module")
 def compose_context(browser: Browser) -> Generator[BrowserContext]:
     """Create a release in the compose phase with completed tasks."""
-    context = browser.new_context(ignore_https_errors=True)
+    context = helpers.new_context(browser)
     page = context.new_page()
 
     helpers.log_in(page)
@@ -0,0 +1,26 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from playwright.sync_api import Page
+
+
+def click_restart_and_wait(page: Page) -> None:
+    """Restart all checks and wait for the server to acknowledge the restart."""
+    with page.expect_response(lambda r: (r.request.method == "POST") and ("/draft/fresh/" in r.url)) as response_info:
+        page.get_by_role("button", name="Restart all checks").click()
+    # The server redirects back to the compose page on success
+    assert response_info.value.status < 400
@@ -15,65 +15,37 @@
 # specific language governing permissions and limitations
 # under the License.
 
-import re
+from typing import Final
 
+import e2e.compose.helpers as helpers  # type: ignore[reportMissingImports]
 from playwright.sync_api import Page, expect
 
-
-def test_ongoing_tasks_banner_appears_when_tasks_restart(page_compose: Page) -> None:
-    """The ongoing tasks banner should appear when tasks are restarted."""
-    banner = page_compose.locator("#ongoing-tasks-banner")
-    expect(banner).to_be_hidden()
-
-    restart_button = page_compose.get_by_role("button", name="Restart all checks")
-    restart_button.click()
-
-    expect(banner).to_be_visible(timeout=10000)
-
-
-def test_ongoing_tasks_banner_has_progress_bar(page_compose: Page) -> None:
-    """The ongoing tasks banner should have a progress bar."""
-    restart_button = page_compose.get_by_role("button", name="Restart all checks")
-    restart_button.click()
-
-    progress_bar = page_compose.locator("#poll-progress")
-    expect(progress_bar).to_be_visible(timeout=10000)
-
-
-def test_ongoing_tasks_banner_has_task_count(page_compose: Page) -> None:
-    """The ongoing tasks banner should display the task count."""
-    restart_button = page_compose.get_by_role("button", name="Restart all checks")
-    restart_button.click()
-
-    count_element = page_compose.locator("#ongoing-tasks-count")
-    expect(count_element).to_be_visible(timeout=10000)
-    expect(count_element).not_to_be_empty()
-
-
-def test_ongoing_tasks_banner_has_warning_icon(page_compose: Page) -> None:
-    """The ongoing tasks banner should have a warning icon when visible."""
-    restart_button = page_compose.get_by_role("button", name="Restart all checks")
-    restart_button.click()
-
-    warning_icon = page_compose.locator("#ongoing-tasks-banner i.bi-exclamation-triangle")
-    expect(warning_icon).to_be_visible(timeout=10000)
+# Poll often so that completion is seen quickly
+_BANNER_HIDDEN_POLL_MS: Final[int] = 100
+_BANNER_HIDDEN_TIMEOUT_MS: Final[int] = 60000
+_VOTE_HREF_PREFIX: Final[str] = "/voting/test/0.1+e2e-compose/"
 
 
 def test_ongoing_tasks_banner_hidden_when_complete(page_compose: Page) -> None:
     """The ongoing tasks banner should be hidden when all tasks are complete."""
-    banner = page_compose.locator("#ongoing-tasks-banner")
-    expect(banner).to_be_hidden(timeout=60000)
+    _wait_for_banner_hidden(page_compose)
 
 
-def test_ongoing_tasks_banner_hides_when_tasks_complete(page_compose: Page) -> None:
-    """The ongoing tasks banner should hide when all tasks complete."""
-    restart_button = page_compose.get_by_role("button", name="Restart all checks")
-    restart_button.click()
-
+def test_ongoing_tasks_banner_lifecycle(page_compose: Page) -> None:
+    """The ongoing tasks banner should appear with its details on restart, then hide when tasks complete."""
     banner = page_compose.locator("#ongoing-tasks-banner")
+    count_element = page_compose.locator("#ongoing-tasks-count")
+    warning_icon = page_compose.locator("#ongoing-tasks-banner i.bi-exclamation-triangle")
+
+    expect(banner).to_be_hidden()
+    helpers.click_restart_and_wait(page_compose)
     expect(banner).to_be_visible(timeout=10000)
+    expect(page_compose.locator("#poll-progress")).to_be_visible(timeout=10000)
+    expect(count_element).to_be_visible(timeout=10000)
+    expect(count_element).not_to_be_empty()
+    expect(warning_icon).to_be_visible(timeout=10000)
 
-    expect(banner).to_be_hidden(timeout=60000)
+    _wait_for_banner_hidden(page_compose)
 
 
 def test_ongoing_tasks_script_loaded(page_compose: Page) -> None:
@@ -91,11 +63,27 @@ def test_start_vote_button_enabled_when_tasks_complete(page_compose: Page) -> No
 
 def test_start_vote_button_has_href(page_compose: Page) -> None:
     """The start vote button should have an href attribute set."""
+    _wait_for_banner_hidden(page_compose)
     vote_button = page_compose.locator("#start-vote-button")
-    expect(vote_button).to_have_attribute("href", re.compile(r"/voting/test/0\.1\+e2e-compose/\d+"))
+    _assert_vote_href(vote_button.get_attribute("href"))
 
 
 def test_start_vote_button_has_title(page_compose: Page) -> None:
     """The start vote button should have a descriptive title."""
+    _wait_for_banner_hidden(page_compose)
     vote_button = page_compose.locator("#start-vote-button")
     expect(vote_button).to_have_attribute("title", "Start a vote on this draft")
+
+
+def _assert_vote_href(href: str | None) -> None:
+    # The script sets the href before hiding the banner, so one read suffices
+    assert (href is not None) and href.startswith(_VOTE_HREF_PREFIX), f"Unexpected vote href: {href!r}"
+    assert href.removeprefix(_VOTE_HREF_PREFIX).isdigit(), f"Unexpected vote href: {href!r}"
+
+
+def _wait_for_banner_hidden(page: Page) -> None:
+    page.wait_for_function(
+        "() => { const b = document.getElementById('ongoing-tasks-banner'); return !b || !b.checkVisibility(); }",
+        polling=_BANNER_HIDDEN_POLL_MS,
+        timeout=_BANNER_HIDDEN_TIMEOUT_MS,
+    )
@@ -15,9 +15,34 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from typing import Any
+
 import pytest
 
 
 @pytest.fixture(scope="session")
 def browser_context_args() -> dict[str, bool]:
     return {"ignore_https_errors": True}
+
+
+@pytest.fixture(scope="session")
+def browser_type_launch_args(browser_type_launch_args: dict[str, Any]) -> dict[str, Any]:
+    # Reduce background work in the browser, which runs inside a container
+    return {
+        **browser_type_launch_args,
+        "args": ["--disable-dev-shm-usage", "--disable-background-networking", "--disable-extensions"],
+    }
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    for item in items:
+        # Keep each module on one worker so that module scoped releases are shared
+        # The policy modules all mutate the same project, so they share one worker
+        group = item.path.parent.name if (item.path.parent.name == "policy") else item.nodeid.split("::")[0]
+        item.add_marker(pytest.mark.xdist_group(group))
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "readonly: the test never writes server state, so no cleanup is needed")
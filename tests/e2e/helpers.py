@@ -16,9 +16,9 @@
 # under the License.
 
 import os
-from typing import Any, Final
+from typing import Any, Final, Literal
 
-from playwright.sync_api import APIRequestContext, Page
+from playwright.sync_api import APIRequestContext, APIResponse, Browser, BrowserContext, Page
 
 _ATR_BASE_URL: Final[str] = os.environ.get("ATR_BASE_URL", "https://localhost.apache.org:8080")
 
@@ -28,6 +28,10 @@ def api_get(request: APIRequestContext, path: str) -> dict[str, Any]:
     return response.json()
 
 
+def api_post_form(request: APIRequestContext, path: str, form: dict[str, str]) -> APIResponse:
+    return request.post(f"{_ATR_BASE_URL}{path}", form=form)
+
+
 def delete_release_if_exists(page: Page, project_name: str, version_name: str) -> None:
     release_name = f"{project_name}-{version_name}"
     visit(page, "/admin/delete-release")
@@ -45,6 +49,10 @@ def log_in(page: Page) -> None:
     page.wait_for_load_state()
 
 
-def visit(page: Page, path: str) -> None:
-    page.goto(f"{_ATR_BASE_URL}{path}")
-    page.wait_for_load_state()
+def new_context(browser: Browser, **kwargs: Any) -> BrowserContext:
+    return browser.new_context(ignore_https_errors=True, **kwargs)
+
+
+def visit(page: Page, path: str, wait_until: Literal["domcontentloaded", "load"] = "load") -> None:
+    page.goto(f"{_ATR_BASE_URL}{path}", wait_until=wait_until)
+    page.wait_for_load_state(wait_until)
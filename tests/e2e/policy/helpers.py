@@ -15,21 +15,50 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import weakref
 from typing import Final
 
+import e2e.helpers as root_helpers
 from playwright.sync_api import Locator, Page
 
 PROJECT_NAME: Final[str] = "test"
 PROJECT_URL: Final[str] = f"/projects/{PROJECT_NAME}"
 
+_global_locators: Final[weakref.WeakKeyDictionary[Page, dict[str, Locator]]] = weakref.WeakKeyDictionary()
+
+
+def compose_form(page: Page) -> Locator:
+    return _locator(page, "form.atr-canary >> nth=0")
+
+
+def compose_form_save(page: Page) -> None:
+    # Wait for the POST response only, as the following visit makes a load wait redundant
+    with page.expect_response(lambda r: (r.request.method == "POST") and (PROJECT_URL in r.url)):
+        compose_form_save_button(page).click()
+
 
 def compose_form_save_button(page: Page) -> Locator:
-    return page.locator('form.atr-canary button[type="submit"]').first
+    return _locator(page, 'form.atr-canary button[type="submit"] >> nth=0')
 
 
 def textarea_source_excludes_lightweight(page: Page) -> Locator:
-    return page.locator('textarea[name="source_excludes_lightweight"]')
+    return _locator(page, 'textarea[name="source_excludes_lightweight"]')
 
 
 def textarea_source_excludes_rat(page: Page) -> Locator:
-    return page.locator('textarea[name="source_excludes_rat"]')
+    return _locator(page, 'textarea[name="source_excludes_rat"]')
+
+
+def visit_project(page: Page) -> None:
+    # The assertions retry on the form itself, so there is no need to wait for subresources
+    root_helpers.visit(page, PROJECT_URL, wait_until="domcontentloaded")
+
+
+def _locator(page: Page, selector: str) -> Locator:
+    # Locators resolve lazily, so one per page and selector stays valid across navigations
+    locators = _global_locators.setdefault(page, {})
+    locator = locators.get(selector)
+    if locator is None:
+        locator = page.locator(selector)
+        locators[selector] = locator
+    return locator
@@ -16,8 +16,11 @@
 # under the License.
 
 import e2e.policy.helpers as helpers
+import pytest
 from playwright.sync_api import Page, expect
 
+pytestmark = pytest.mark.readonly
+
 
 def test_source_excludes_lightweight_initially_empty(page_project: Page) -> None:
     textarea = helpers.textarea_source_excludes_lightweight(page_project)
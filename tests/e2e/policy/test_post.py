@@ -15,7 +15,6 @@
 # specific language governing permissions and limitations
 # under the License.
 
-import e2e.helpers as root_helpers
 import e2e.policy.helpers as helpers
 from playwright.sync_api import Page, expect
 
@@ -23,16 +22,14 @@ from playwright.sync_api import Page, expect
 def test_source_excludes_lightweight_can_be_cleared(page_project: Page) -> None:
     textarea = helpers.textarea_source_excludes_lightweight(page_project)
     textarea.fill("*.min.js")
-    helpers.compose_form_save_button(page_project).click()
-    page_project.wait_for_load_state()
+    helpers.compose_form_save(page_project)
 
-    root_helpers.visit(page_project, helpers.PROJECT_URL)
+    helpers.visit_project(page_project)
     textarea = helpers.textarea_source_excludes_lightweight(page_project)
     textarea.fill("")
-    helpers.compose_form_save_button(page_project).click()
-    page_project.wait_for_load_state()
+    helpers.compose_form_save(page_project)
 
-    root_helpers.visit(page_project, helpers.PROJECT_URL)
+    helpers.visit_project(page_project)
     textarea = helpers.textarea_source_excludes_lightweight(page_project)
     expect(textarea).to_have_value("")
 
@@ -42,10 +39,9 @@ def test_source_excludes_lightweight_preserves_internal_whitespace(page_project:
     # Anyway, this is an edge case, and perhaps normalisation would even be better
     textarea = helpers.textarea_source_excludes_lightweight(page_project)
     textarea.fill("first\n  middle with spaces  \nlast")
-    helpers.compose_form_save_button(page_project).click()
-    page_project.wait_for_load_state()
+    helpers.compose_form_save(page_project)
 
-    root_helpers.visit(page_project, helpers.PROJECT_URL)
+    helpers.visit_project(page_project)
     textarea = helpers.textarea_source_excludes_lightweight(page_project)
     expect(textarea).to_have_value("first\n  middle with spaces  \nlast")
 
@@ -53,10 +49,9 @@ def test_source_excludes_lightweight_preserves_internal_whitespace(page_project:
 def test_source_excludes_lightweight_value_persists(page_project: Page) -> None:
     textarea = helpers.textarea_source_excludes_lightweight(page_project)
     textarea.fill("*.min.js\nvendor/**")
-    helpers.compose_form_save_button(page_project).click()
-    page_project.wait_for_load_state()
+    helpers.compose_form_save(page_project)
 
-    root_helpers.visit(page_project, helpers.PROJECT_URL)
+    helpers.visit_project(page_project)
     textarea = helpers.textarea_source_excludes_lightweight(page_project)
     expect(textarea).to_have_value("*.min.js\nvendor/**")
 
@@ -64,9 +59,8 @@ def test_source_excludes_lightweight_value_persists(page_project: Page) -> None:
 def test_source_excludes_rat_value_persists(page_project: Page) -> None:
     textarea = helpers.textarea_source_excludes_rat(page_project)
     textarea.fill("third-party/**\n*.generated")
-    helpers.compose_form_save_button(page_project).click()
-    page_project.wait_for_load_state()
+    helpers.compose_form_save(page_project)
 
-    root_helpers.visit(page_project, helpers.PROJECT_URL)
+    helpers.visit_project(page_project)
     textarea = helpers.textarea_source_excludes_rat(page_project)
     expect(textarea).to_have_value("third-party/**\n*.generated")
@@ -93,7 +93,7 @@ def primary_success_toggle(page_report: Page) -> Locator:
 @pytest.fixture(scope="module")
 def report_context(browser: Browser, verify_license_check_mode: None) -> Generator[BrowserContext]:
     """Create a release with an uploaded file and completed tasks."""
-    context = browser.new_context(ignore_https_errors=True)
+    context = helpers.new_context(browser)
     page = context.new_page()
 
     helpers.log_in(page)
@@ -123,7 +123,7 @@ def report_context(browser: Browser, verify_license_check_mode: None) -> Generat
 @pytest.fixture(scope="module")
 def verify_license_check_mode(browser: Browser) -> None:
     """Verify that the test project has the correct license check mode."""
-    context = browser.new_context(ignore_https_errors=True)
+    context = helpers.new_context(browser)
     policy = helpers.api_get(context.request, f"/api/project/policy/{PROJECT_NAME}")
     context.close()
 
@@ -36,19 +36,20 @@ VOTE_URL: Final[str] = f"/vote/{PROJECT_NAME}/{VERSION_NAME}"
 
 
 @pytest.fixture
-def page_vote(vote_context: BrowserContext) -> Generator[Page]:
-    """Navigate to the vote page with a fresh page for each test."""
-    page = vote_context.new_page()
-    helpers.visit(page, VOTE_URL)
-    yield page
-    page.close()
+def page_vote(vote_page: Page) -> Generator[Page]:
+    """Share the vote page, letting copy buttons restore their text after each test."""
+    yield vote_page
+    # Resetting the text directly would race with the restore timers of the page script
+    vote_page.wait_for_function(
+        "() => ![...document.querySelectorAll('.atr-copy-btn')].some(b => /Copied!|Failed!/.test(b.textContent))"
+    )
 
 
 @pytest.fixture(scope="module")
 def vote_context(browser: Browser) -> Generator[BrowserContext]:
     """Create a release in the vote phase."""
-    context = browser.new_context(
-        ignore_https_errors=True,
+    context = helpers.new_context(
+        browser,
         permissions=["clipboard-read", "clipboard-write"],
     )
     page = context.new_page()
@@ -83,6 +84,15 @@ def vote_context(browser: Browser) -> Generator[BrowserContext]:
     context.close()
 
 
+@pytest.fixture(scope="module")
+def vote_page(vote_context: BrowserContext) -> Generator[Page]:
+    """Navigate to the vote page once for the module, as the tests only read from it."""
+    page = vote_context.new_page()
+    helpers.visit(page, VOTE_URL)
+    yield page
+    page.close()
+
+
 def _wait_for_tasks_banner_hidden(page: Page, timeout: int = 30000) -> None:
     """Wait for all background tasks to be completed."""
     page.wait_for_selector("#ongoing-tasks-banner", state="hidden", timeout=timeout)
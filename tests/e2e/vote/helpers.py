@@ -15,24 +15,49 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import weakref
+from typing import Final
+
 from playwright.sync_api import Locator, Page
 
+_global_locators: Final[weakref.WeakKeyDictionary[Page, dict[str, Locator]]] = weakref.WeakKeyDictionary()
+
 
 def get_curl_command_text(page: Page) -> Locator:
     """Return the curl command text locator."""
-    return page.locator("#curl-command")
+    return _locator(page, "#curl-command")
 
 
 def get_curl_copy_button(page: Page) -> Locator:
     """Return the curl command copy button locator."""
-    return page.locator('button.atr-copy-btn[data-clipboard-target="#curl-command"]')
+    return _locator(page, 'button.atr-copy-btn[data-clipboard-target="#curl-command"]')
 
 
 def get_rsync_command_text(page: Page) -> Locator:
     """Return the rsync command text locator."""
-    return page.locator("#rsync-command")
+    return _locator(page, "#rsync-command")
 
 
 def get_rsync_copy_button(page: Page) -> Locator:
     """Return the rsync command copy button locator."""
-    return page.locator('button.atr-copy-btn[data-clipboard-target="#rsync-command"]')
+    return _locator(page, 'button.atr-copy-btn[data-clipboard-target="#rsync-command"]')
+
+
+def wait_for_text(page: Page, locator: Locator, text: str) -> None:
+    """Wait for the element text to contain the given text, polling often to catch fast transitions."""
+    page.wait_for_function(
+        "([element, text]) => element.textContent.includes(text)",
+        arg=[locator.element_handle(), text],
+        polling=50,
+        timeout=5000,
+    )
+
+
+def _locator(page: Page, selector: str) -> Locator:
+    # Locators resolve lazily, so one per page and selector stays valid across navigations
+    locators = _global_locators.setdefault(page, {})
+    locator = locators.get(selector)
+    if locator is None:
+        locator = page.locator(selector)
+        locators[selector] = locator
+    return locator
@@ -37,7 +37,7 @@ def test_curl_copy_button_restores_original_text(page_vote: Page) -> None:
     copy_button = helpers.get_curl_copy_button(page_vote)
     copy_button.click()
 
-    expect(copy_button).to_contain_text("Copy", timeout=5000)
+    helpers.wait_for_text(page_vote, copy_button, "Copy")
 
 
 def test_curl_copy_button_shows_copied_feedback(page_vote: Page) -> None:
@@ -96,7 +96,7 @@ def test_rsync_copy_button_restores_original_text(page_vote: Page) -> None:
     copy_button = helpers.get_rsync_copy_button(page_vote)
     copy_button.click()
 
-    expect(copy_button).to_contain_text("Copy", timeout=5000)
+    helpers.wait_for_text(page_vote, copy_button, "Copy")
 
 
 def test_rsync_copy_button_shows_copied_feedback(page_vote: Page) -> None:
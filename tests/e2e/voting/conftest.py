@@ -49,7 +49,7 @@ def page_voting(voting_context: BrowserContext) -> Generator[Page]:
 @pytest.fixture(scope="module")
 def voting_context(browser: Browser) -> Generator[BrowserContext]:
     """Create a release ready for voting."""
-    context = browser.new_context(ignore_https_errors=True)
+    context = helpers.new_context(browser)
     page = context.new_page()
 
     helpers.log_in(page)
@@ -19,6 +19,6 @@ then
 fi
 
 docker compose build e2e-dev
-docker compose run --rm e2e-dev pytest "e2e/$1/" -v
+docker compose run --rm e2e-dev pytest "e2e/$1/" -v --browser chromium -n auto --dist=loadgroup
 
 echo "Use 'docker compose down atr-dev' to stop the dev container"
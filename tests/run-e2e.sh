@@ -20,7 +20,7 @@ then
 fi
 
 docker compose build e2e-dev
-if ! docker compose run --rm e2e-dev pytest e2e/ -v
+if ! docker compose run --rm e2e-dev pytest e2e/ -v --browser chromium -n auto --dist=loadgroup
 then
   exit_code=$?
   echo "ERROR: e2e tests failed with exit code ${exit_code}"
@@ -0,0 +1,239 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import hashlib
+import pathlib
+from typing import Any
+
+import pytest
+
+import atr.models.sql as sql
+import atr.tasks as tasks
+import atr.tasks.checks as checks
+import atr.tasks.checks.hashing as hashing
+
+ARTIFACT_CONTENT = b"apache-test artifact content\n"
+ARTIFACT_NAME = "apache-test-0.1.tar.gz"
+
+
+class RecordingRecorder(checks.Recorder):
+    """A recorder that keeps results in memory and reads files from a local directory."""
+
+    def __init__(self, base: pathlib.Path, primary_rel_path: str) -> None:
+        super().__init__(hashing.check, "test", "0.1", "00001", primary_rel_path=primary_rel_path)
+        self.base = base
+        self.constructed = True
+        self.results: list[tuple[sql.CheckResultStatus, str]] = []
+
+    async def _add(
+        self,
+        status: sql.CheckResultStatus,
+        message: str,
+        data: Any,
+        primary_rel_path: str | None = None,
+        member_rel_path: str | None = None,
+    ) -> sql.CheckResult:
+        self.results.append((status, message))
+        return self._result(status, message, data, primary_rel_path, member_rel_path)
+
+    def abs_path_base(self) -> pathlib.Path:
+        return self.base
+
+
+@pytest.fixture
+def revision_dir(tmp_path: pathlib.Path) -> pathlib.Path:
+    (tmp_path / ARTIFACT_NAME).write_bytes(ARTIFACT_CONTENT)
+    (tmp_path / f"{ARTIFACT_NAME}.sha256").write_text(f"{hashlib.sha256(ARTIFACT_CONTENT).hexdigest()}\n")
+    (tmp_path / f"{ARTIFACT_NAME}.sha512").write_text(f"{hashlib.sha512(ARTIFACT_CONTENT).hexdigest()}\n")
+    return tmp_path
+
+
+async def test_check_paired_sidecars(revision_dir: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    primary = RecordingRecorder(revision_dir, f"{ARTIFACT_NAME}.sha256")
+    sibling = RecordingRecorder(revision_dir, f"{ARTIFACT_NAME}.sha512")
+    monkeypatch.setattr(checks.Recorder, "create", _returning(sibling))
+
+    await hashing.check(_arguments(primary, extra_args={"sibling_rel_path": f"{ARTIFACT_NAME}.sha512"}))
+
+    assert primary.results == [(sql.CheckResultStatus.SUCCESS, "Hash (sha256) matches expected value")]
+    assert sibling.results == [(sql.CheckResultStatus.SUCCESS, "Hash (sha512) matches expected value")]
+
+
+async def test_check_paired_sidecars_reports_each_mismatch(revision_dir: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    (revision_dir / f"{ARTIFACT_NAME}.sha512").write_text(f"{hashlib.sha512(b'other').hexdigest()}\n")
+    primary = RecordingRecorder(revision_dir, f"{ARTIFACT_NAME}.sha256")
+    sibling = RecordingRecorder(revision_dir, f"{ARTIFACT_NAME}.sha512")
+    monkeypatch.setattr(checks.Recorder, "create", _returning(sibling))
+
+    await hashing.check(_arguments(primary, extra_args={"sibling_rel_path": f"{ARTIFACT_NAME}.sha512"}))
+
+    assert primary.results == [(sql.CheckResultStatus.SUCCESS, "Hash (sha256) matches expected value")]
+    assert sibling.results == [(sql.CheckResultStatus.FAILURE, "Hash (sha512) mismatch")]
+
+
+async def test_check_single_sidecar(revision_dir: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    primary = RecordingRecorder(revision_dir, f"{ARTIFACT_NAME}.sha512")
+    monkeypatch.setattr(checks.Recorder, "create", _unexpected_create)
+
+    await hashing.check(_arguments(primary))
+
+    assert primary.results == [(sql.CheckResultStatus.SUCCESS, "Hash (sha512) matches expected value")]
+
+
+def test_compute_hashes_sync_matches_hashlib(revision_dir: pathlib.Path):
+    digests = hashing._compute_hashes_sync(revision_dir / ARTIFACT_NAME, ["sha256", "sha512"])
+    assert digests == {
+        "sha256": hashlib.sha256(ARTIFACT_CONTENT).digest(),
+        "sha512": hashlib.sha512(ARTIFACT_CONTENT).digest(),
+    }
+
+
+def test_digest_matches_correct_digest():
+    digest = hashlib.sha512(ARTIFACT_CONTENT).digest()
+    assert hashing._digest_matches(digest, digest.hex())
+
+
+@pytest.mark.parametrize("expected_hash", ["", "not hex", "abc", "zz" * 64])
+def test_digest_matches_malformed_hash(expected_hash: str):
+    assert not hashing._digest_matches(hashlib.sha512(ARTIFACT_CONTENT).digest(), expected_hash)
+
+
+def test_digest_matches_uppercase_hex():
+    digest = hashlib.sha512(ARTIFACT_CONTENT).digest()
+    assert hashing._digest_matches(digest, digest.hex().upper())
+
+
+def test_digest_matches_wrong_digest():
+    digest = hashlib.sha512(ARTIFACT_CONTENT).digest()
+    assert not hashing._digest_matches(digest, hashlib.sha512(b"other").hexdigest())
+    # A shorter digest of the same content must not match either
+    assert not hashing._digest_matches(digest, hashlib.sha256(ARTIFACT_CONTENT).hexdigest())
+
+
+async def test_sidecar_correct_digest(revision_dir: pathlib.Path):
+    result = await _check_sidecar_text(revision_dir, f"{_sha512_hex()}\n")
+    assert result == (sql.CheckResultStatus.SUCCESS, "Hash (sha512) matches expected value")
+
+
+async def test_sidecar_digest_and_filename(revision_dir: pathlib.Path):
+    result = await _check_sidecar_text(revision_dir, f"{_sha512_hex()}  {ARTIFACT_NAME}\n")
+    assert result == (sql.CheckResultStatus.SUCCESS, "Hash (sha512) matches expected value")
+
+
+async def test_sidecar_malformed(revision_dir: pathlib.Path):
+    result = await _check_sidecar_text(revision_dir, f"{_sha512_hex()[:-1]}g\n")
+    assert result == (sql.CheckResultStatus.FAILURE, "Hash (sha512) mismatch")
+
+
+async def test_sidecar_non_hex(revision_dir: pathlib.Path):
+    result = await _check_sidecar_text(revision_dir, "this is not a digest\n")
+    assert result == (sql.CheckResultStatus.FAILURE, "Hash (sha512) mismatch")
+
+
+async def test_sidecar_over_size_cap_reads_leading_digest(revision_dir: pathlib.Path):
+    padding = "#" * hashing._HASH_FILE_MAX_CHARS
+    result = await _check_sidecar_text(revision_dir, f"{_sha512_hex()}  {ARTIFACT_NAME}\n{padding}\n")
+    assert result == (sql.CheckResultStatus.SUCCESS, "Hash (sha512) matches expected value")
+
+
+async def test_sidecar_over_size_cap_ignores_trailing_digest(revision_dir: pathlib.Path):
+    padding = " " * hashing._HASH_FILE_MAX_CHARS
+    result = await _check_sidecar_text(revision_dir, f"{padding}{_sha512_hex()}\n")
+    assert result == (sql.CheckResultStatus.FAILURE, "Unable to verify hash")
+
+
+async def test_sidecar_uppercase_hex(revision_dir: pathlib.Path):
+    result = await _check_sidecar_text(revision_dir, f"{_sha512_hex().upper()}\n")
+    assert result == (sql.CheckResultStatus.SUCCESS, "Hash (sha512) matches expected value")
+
+
+async def test_sidecar_wrong_digest(revision_dir: pathlib.Path):
+    result = await _check_sidecar_text(revision_dir, f"{hashlib.sha512(b'other').hexdigest()}\n")
+    assert result == (sql.CheckResultStatus.FAILURE, "Hash (sha512) mismatch")
+
+
+async def test_sha_checks_paired_sidecars():
+    release = _release()
+    revision_paths = {ARTIFACT_NAME, f"{ARTIFACT_NAME}.sha256", f"{ARTIFACT_NAME}.sha512"}
+
+    sha256_tasks = await tasks.sha_checks("test", release, "00001", f"{ARTIFACT_NAME}.sha256", revision_paths)
+    sha512_tasks = await tasks.sha_checks("test", release, "00001", f"{ARTIFACT_NAME}.sha512", revision_paths)
+
+    assert len(sha256_tasks) == 1
+    assert sha256_tasks[0].primary_rel_path == f"{ARTIFACT_NAME}.sha256"
+    assert sha256_tasks[0].task_args == {"sibling_rel_path": f"{ARTIFACT_NAME}.sha512"}
+    # The .sha512 file is checked by the .sha256 task
+    assert sha512_tasks == []
+
+
+@pytest.mark.parametrize("algorithm", ["sha256", "sha512"])
+async def test_sha_checks_single_sidecar(algorithm: str):
+    release = _release()
+    hash_file = f"{ARTIFACT_NAME}.{algorithm}"
+
+    sha_tasks = await tasks.sha_checks("test", release, "00001", hash_file, {ARTIFACT_NAME, hash_file})
+
+    assert len(sha_tasks) == 1
+    assert sha_tasks[0].task_type == sql.TaskType.HASHING_CHECK
+    assert sha_tasks[0].primary_rel_path == hash_file
+    assert sha_tasks[0].task_args == {}
+
+
+def _arguments(recorder: RecordingRecorder, extra_args: dict[str, Any] | None = None) -> checks.FunctionArguments:
+    async def get_recorder() -> checks.Recorder:
+        return recorder
+
+    return checks.FunctionArguments(
+        recorder=get_recorder,
+        asf_uid="test",
+        project_name="test",
+        version_name="0.1",
+        revision_number="00001",
+        primary_rel_path=recorder.primary_rel_path,
+        extra_args=extra_args or {},
+    )
+
+
+async def _check_sidecar_text(revision_dir: pathlib.Path, text: str) -> tuple[sql.CheckResultStatus, str]:
+    hash_abs_path = revision_dir / f"{ARTIFACT_NAME}.sha512"
+    hash_abs_path.write_text(text)
+    recorder = RecordingRecorder(revision_dir, hash_abs_path.name)
+    await hashing._check_sidecar(
+        recorder, "sha512", hash_abs_path, revision_dir / ARTIFACT_NAME, hashlib.sha512(ARTIFACT_CONTENT).digest()
+    )
+    [result] = recorder.results
+    return result
+
+
+def _release() -> sql.Release:
+    return sql.Release(project=sql.Project(name="test"), version="0.1")
+
+
+def _returning(recorder: RecordingRecorder) -> Any:
+    async def create(*args: Any, **kwargs: Any) -> checks.Recorder:
+        assert kwargs["primary_rel_path"] == recorder.primary_rel_path
+        return recorder
+
+    return create
+
+
+def _sha512_hex() -> str:
+    return hashlib.sha512(ARTIFACT_CONTENT).hexdigest()
+
+
+async def _unexpected_create(*args: Any, **kwargs: Any) -> checks.Recorder:
+    raise AssertionError("A single sidecar should not create a sibling recorder")
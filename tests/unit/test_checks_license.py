@@ -17,22 +17,29 @@
 
 import pathlib
 
+import pytest
+
 import atr.tasks.checks.license as license
 
 TEST_ARCHIVE = pathlib.Path(__file__).parent.parent / "e2e" / "test_files" / "apache-test-0.2.tar.gz"
 
 
-def test_headers_check_data_fields_match_model():
-    results = list(license._headers_check_core_logic(str(TEST_ARCHIVE), [], "none"))
-    artifact_results = [r for r in results if isinstance(r, license.ArtifactResult)]
+@pytest.fixture(scope="module")
+def results_excludes_none() -> list[license.Result]:
+    # Scan the archive once for all of the tests which use no excludes
+    return list(license._headers_check_core_logic(str(TEST_ARCHIVE), [], "none"))
+
+
+def test_headers_check_data_fields_match_model(results_excludes_none: list[license.Result]):
+    artifact_results = [r for r in results_excludes_none if isinstance(r, license.ArtifactResult)]
     final_result = artifact_results[-1]
     expected_fields = set(license.ArtifactData.model_fields.keys())
     actual_fields = set(final_result.data.keys())
     assert actual_fields == expected_fields
 
 
-def test_headers_check_excludes_matching_files():
-    results_without_excludes = list(license._headers_check_core_logic(str(TEST_ARCHIVE), [], "none"))
+def test_headers_check_excludes_matching_files(results_excludes_none: list[license.Result]):
+    results_without_excludes = results_excludes_none
     results_with_excludes = list(license._headers_check_core_logic(str(TEST_ARCHIVE), ["*.py"], "policy"))
 
     def get_files_checked(results: list) -> int:
@@ -46,9 +53,8 @@ def test_headers_check_excludes_matching_files():
     assert with_excludes < without_excludes
 
 
-def test_headers_check_includes_excludes_source_none():
-    results = list(license._headers_check_core_logic(str(TEST_ARCHIVE), [], "none"))
-    artifact_results = [r for r in results if isinstance(r, license.ArtifactResult)]
+def test_headers_check_includes_excludes_source_none(results_excludes_none: list[license.Result]):
+    artifact_results = [r for r in results_excludes_none if isinstance(r, license.ArtifactResult)]
     assert len(artifact_results) > 0
     final_result = artifact_results[-1]
     assert final_result.data["excludes_source"] == "none"
@@ -0,0 +1,70 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+
+import jinja2
+import pytest
+import quart
+
+import atr.template as template
+
+TEMPLATES = {
+    "greeting.html": "{{ greeting_fn(name, punctuation='!') }}",
+    "stalled.html": "{{ stalled_fn() }}",
+}
+
+
+@pytest.fixture
+def app(monkeypatch: pytest.MonkeyPatch) -> quart.Quart:
+    # Avoid the bytecode cache directory, which needs the application configuration
+    monkeypatch.setattr(
+        template, "_global_sync_env", jinja2.Environment(loader=jinja2.DictLoader(TEMPLATES), autoescape=True)
+    )
+    monkeypatch.setattr(template, "_global_sync_templates", {})
+    return quart.Quart(__name__)
+
+
+async def test_render_sync_awaits_async_function(app: quart.Quart):
+    async def greeting_fn(name: str, punctuation: str) -> str:
+        # Yield to the loop, which must be free while the render thread waits
+        await asyncio.sleep(0)
+        return f"Hello, {name}{punctuation}"
+
+    async with app.app_context():
+        rendered = await template.render_sync("greeting.html", greeting_fn=greeting_fn, name="ATR")
+
+    assert rendered == "Hello, ATR!"
+
+
+async def test_render_sync_times_out_stalled_async_function(app: quart.Quart, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(template, "_ASYNC_CALL_TIMEOUT_S", 0.1)
+    cancelled = asyncio.Event()
+
+    async def stalled_fn() -> str:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "unreachable"
+
+    async with app.app_context():
+        with pytest.raises(TimeoutError):
+            await template.render_sync("stalled.html", stalled_fn=stalled_fn)
+
+    await asyncio.wait_for(cancelled.wait(), timeout=5)
@@ -0,0 +1,100 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import datetime
+import pathlib
+from typing import Any
+
+import pytest
+
+import atr.models.sql as sql
+import atr.validate as validate
+
+NOW = datetime.datetime(2025, 6, 1, tzinfo=datetime.UTC)
+PAST = datetime.datetime(2024, 6, 1, tzinfo=datetime.UTC)
+FUTURE = datetime.datetime(2026, 6, 1, tzinfo=datetime.UTC)
+STARTED = datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC)
+RESOLVED = datetime.datetime(2025, 1, 4, tzinfo=datetime.UTC)
+# The vote_resolved property must not be set unless vote_started is set
+VOTE_DATES = [
+    (None, RESOLVED, False),
+    (STARTED, None, True),
+    (None, None, True),
+    (STARTED, RESOLVED, True),
+]
+VOTE_ENTRY = sql.VoteEntry(
+    result=True, summary="Passed", binding_votes=3, community_votes=5, start=STARTED, end=RESOLVED
+)
+# Each case gives the release fields, and whether the release directory contains a file
+RELEASE_CASES = {
+    "valid": ({"name": "test-0.1", "created": PAST}, True),
+    "released": (
+        {"name": "test-0.1", "created": PAST, "released": PAST, "vote_started": STARTED, "vote_resolved": RESOLVED},
+        True,
+    ),
+    "empty_directory": ({"name": "test-0.1", "created": PAST, "vote_started": STARTED}, False),
+    "future_dates": ({"name": "test-0.1", "created": FUTURE, "released": FUTURE}, True),
+    "all_invalid": (
+        {
+            "name": "test-0.2",
+            "created": FUTURE,
+            "released": FUTURE,
+            "package_managers": ["npm"],
+            "sboms": ["test.cdx.json"],
+            "vote_resolved": RESOLVED,
+            "votes": [VOTE_ENTRY],
+        },
+        False,
+    ),
+}
+
+
+@pytest.mark.parametrize(("fields", "on_disk"), RELEASE_CASES.values(), ids=RELEASE_CASES.keys())
+def test_release_matches_individual_validators(
+    fields: dict[str, Any], on_disk: bool, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(validate, "_now", lambda: NOW)
+    monkeypatch.setattr(validate.util, "release_directory", lambda r: tmp_path)
+    if on_disk:
+        (tmp_path / "test-0.1.tar.gz").write_bytes(b"")
+    r = sql.Release(project_name="test", version="0.1", **fields)
+
+    individual = [
+        *validate.release_created(r),
+        *validate.release_name(r),
+        *validate.release_on_disk(r),
+        *validate.release_package_managers(r),
+        *validate.release_released(r),
+        *validate.release_sboms(r),
+        *validate.release_vote_logic(r),
+        *validate.release_votes(r),
+    ]
+    assert validate.release(r) == individual
+
+
+@pytest.mark.parametrize(("vote_started", "vote_resolved", "okay"), VOTE_DATES)
+def test_release_vote_logic(
+    vote_started: datetime.datetime | None, vote_resolved: datetime.datetime | None, okay: bool
+):
+    release = sql.Release(project_name="test", version="0.1", vote_started=vote_started, vote_resolved=vote_resolved)
+    divergences = list(validate.release_vote_logic(release))
+    assert (divergences == []) is okay
+
+
+@pytest.mark.parametrize(("vote_started", "vote_resolved", "okay"), VOTE_DATES)
+def test_vote_logic_okay(vote_started: datetime.datetime | None, vote_resolved: datetime.datetime | None, okay: bool):
+    assert validate._vote_logic_okay((vote_started, vote_resolved)) is okay